@@ -1,10 +1,17 @@
 # Re-export the thin-wrapper module so callers can 
 # from microseq_tests import pipeline 
-from importlib import import_module as _imp 
+# The pipeline graph (Bio, pandas, biom, ...) is imported lazily on first access
 import importlib, sys 
-pipeline = _imp('.pipeline', __name__) # noqa: F401
 
 __all__ = ['pipeline']
 
-sys.modules["microseq"] = importlib.import_module(__name__) 
+def __getattr__(name: str):
+    # PEP 562 hook - only runs when normal attribute lookup fails
+    if name == "pipeline":
+        mod = importlib.import_module(".pipeline", __name__)
+        globals()["pipeline"] = mod
+        return mod
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+sys.modules["microseq"] = sys.modules[__name__] 
 __version__ = "1.0" # bump in version will update 
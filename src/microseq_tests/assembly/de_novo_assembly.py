@@ -14,14 +14,35 @@ from __future__ import annotations
 import logging
 L = logging.getLogger(__name__)
 
+import errno
+import os
 from pathlib import Path
 import shutil
 import subprocess
+from microseq_tests.utility.io_utils import clear_stamp, is_up_to_date, run_stamp, write_stamp
 from microseq_tests.utility.utils import load_config, setup_logging 
 
 PathLike = str | Path 
 
-def de_novo_assembly(input_fasta: PathLike, output_dir: PathLike, *, threads: int=1, **kwargs, ) -> Path: 
+def _stage_input(src: Path, dst: Path) -> None:
+    """Expose ``src`` at ``dst`` for CAP3: hardlink, then symlink across devices, copy as a last resort."""
+    if dst.exists() or dst.is_symlink():
+        if dst.exists() and os.path.samefile(src, dst):
+            return # already staged from an earlier run 
+        dst.unlink()
+    try:
+        os.link(src, dst)
+        return
+    except OSError as exc:
+        if exc.errno == errno.EXDEV:
+            try:
+                os.symlink(src, dst)
+                return
+            except OSError:
+                pass
+    shutil.copy2(src, dst)
+
+def de_novo_assembly(input_fasta: PathLike, output_dir: PathLike, *, threads: int=1, reuse: bool = False, **kwargs, ) -> Path: 
     """
     Run CAP3 on ``input_fasta``.
 
@@ -33,6 +54,10 @@ def de_novo_assembly(input_fasta: PathLike, output_dir: PathLike, *, threads: in
         Trimmed reads in FASTA format here. 
     output_dir: str 
         Folder where CAP3 files are written in. 
+    reuse: bool 
+        Return an existing ``*.cap.contigs`` instead of re-running CAP3, but only when
+        its stamp shows the same input (path, size, mtime) and the same CAP3 argv.
+        Off by default: CAP3 always runs. 
 
     Returns
     pathlib.Path
@@ -46,10 +71,16 @@ def de_novo_assembly(input_fasta: PathLike, output_dir: PathLike, *, threads: in
     out_dir.mkdir(parents=True, exist_ok=True)
 
     local_fasta = out_dir / in_path.name
+    contig_path = out_dir / f"{local_fasta.name}.cap.contigs"
+    cmd = [cap3_exe, local_fasta.name]
+    stamp = run_stamp([in_path], argv=cmd)
+    if reuse and is_up_to_date(contig_path, stamp):
+        L.info("CAP3 contigs up to date; skipping assembly: %s", contig_path)
+        return contig_path
+    clear_stamp(contig_path)
     if in_path != local_fasta:
-        shutil.copy2(in_path, local_fasta)
+        _stage_input(in_path, local_fasta)
 
-    cmd = [cap3_exe, local_fasta.name]
     L.info("RUN CAP3: %s (cwd=%s)", " ".join(cmd), out_dir)
 
     try:
@@ -70,9 +101,9 @@ def de_novo_assembly(input_fasta: PathLike, output_dir: PathLike, *, threads: in
             L.error("CAP3 stdout:\n%s", exc.stdout)
         raise 
 
-    contig_path = out_dir / f"{local_fasta.name}.cap.contigs"
     if not contig_path.exists():
         raise FileNotFoundError(contig_path)
+    write_stamp(contig_path, stamp)
 
     L.info("CAP3 finished; contigs file: %s", contig_path) 
     return contig_path 
@@ -9,13 +9,16 @@ import logging # print warning messages
 import shlex
 from os import PathLike
 import subprocess 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timezone 
 from typing import Iterable, Sequence, Literal
 import re
 
 from Bio import SeqIO 
+from Bio.SeqIO.FastaIO import SimpleFastaParser
 
+from microseq_tests.utility.io_utils import clear_stamp, is_up_to_date, run_stamp, write_stamp
 from microseq_tests.utility.utils import load_config 
 
 from .pairing import DupPolicy, group_pairs 
@@ -24,6 +27,8 @@ from .overlap_backends import resolve_overlap_engine
 
 L = logging.getLogger(__name__) 
 
+_LOG_TAIL_BYTES = 8192 # how much CAP3 stderr is echoed into the run log 
+
 def _safe_log_token(value: str) -> str:
     token = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(value or "").strip()) # normalize unsafe chars 
     return token.strip("_") or "cap3" # never empty so fallback to prevent blank stem 
@@ -55,17 +60,25 @@ def write_cap3_process_logs(
     stderr_path.write_text(header + (stderr_text or ""), encoding="utf-8")  # side effect: writes stderr artifact
     return stdout_path, stderr_path  # invariant: paths are concrete filesystem locations
 
+def _read_log_tail(path: Path, start: int = 0, *, max_bytes: int = _LOG_TAIL_BYTES) -> str:
+    """Return at most the last ``max_bytes`` written to ``path`` after offset ``start``."""
+    size = path.stat().st_size
+    with path.open("rb") as fh:
+        fh.seek(max(start, size - max_bytes))
+        return fh.read().decode("utf-8", errors="replace")
+
 def _iter_paths(value: Path | list[Path]) -> Iterable[Path]:
     """Normalize a stored path entry such as a list into an iterator."""
+    # group_pairs already stores Path objects; only coerce str/PathLike entries 
     if isinstance(value, list):
         for item in value: 
-            yield Path(item)
+            yield item if isinstance(item, Path) else Path(item)
     else:
-            yield Path(value)  
+            yield value if isinstance(value, Path) else Path(value)  
 
 def _as_path_list(value: Path | list[Path]) -> list[Path]:
     """Return a list of `path` objects perserving insertion order."""
-    return [Path(p) for p in _iter_paths(value)]
+    return list(_iter_paths(value))
 
 def _build_keep_separate_pairs(forward: list[Path], reverse: list[Path]) -> list[tuple[Path, Path]]:
     """Produce forward/reverse pairings for the keep-separate policy."""
@@ -156,7 +169,9 @@ def _validate_cap3_contig_support(
 def _write_combined_fasta(sources: Iterable[Path], destination: Path, *, use_qual: bool = True) -> None: 
     """ 
     Here I will combine multiple FASTA files into 'destination' and appending matching QUALS.
-    Each input FASTA is written in-order. When a sibling ``.qual`` file is
+    Each input FASTA is streamed record by record with ``SimpleFastaParser`` (no
+    SeqRecord objects) and written unwrapped in-order, so the FASTA and QUAL
+    outputs are built from the same parsed records. When a sibling ``.qual`` file is
     available (``<fasta>.qual``), its records are appended in the same order and
     validated to ensure IDs and sequence/quality lengths match. If a source FASTA
     lacks a ``.qual`` file, log a warning and skip its QUAL contribution.
@@ -168,37 +183,38 @@ def _write_combined_fasta(sources: Iterable[Path], destination: Path, *, use_qua
 
     with destination.open("w", encoding="utf-8") as fasta_out:
         for src in sources:
-            records = list(SeqIO.parse(src, "fasta"))
-            if not records:
-                continue
-            SeqIO.write(records, fasta_out, "fasta")
-
-            if not use_qual:
-                continue
-
             qual_src = Path(f"{src}.qual")
-            if not qual_src.exists():
-                L.warning("Missing QUAL file for %s; skipping quality output for this source.", src)
-                continue
-
-            qual_records = {rec.id: rec for rec in SeqIO.parse(qual_src, "qual")}
-            if qual_out_handle is None:
-                qual_out_handle = qual_out_path.open("w", encoding="utf-8")
+            qual_records = None # loaded on the first record so empty sources never touch QUAL 
+            qual_missing = False 
+            with open(src, "r", encoding="utf-8") as fasta_in:
+                for title, seq in SimpleFastaParser(fasta_in):
+                    fasta_out.write(f">{title}\n{seq}\n")
 
-            for record in records:
-                qual_rec = qual_records.get(record.id)
-                if qual_rec is None:
-                    raise ValueError(
-                        f"QUAL record missing for {record.id} in {qual_src}"
-                    )
-                quals = qual_rec.letter_annotations.get("phred_quality", [])
-                if len(quals) != len(record.seq):
-                    raise ValueError(
-                        f"Quality length mismatch for {record.id} in {qual_src}: "
-                        f"{len(quals)} != {len(record.seq)}"
-                    )
-                qual_rec.description = ""
-                SeqIO.write(qual_rec, qual_out_handle, "qual")
+                    if not use_qual or qual_missing:
+                        continue
+                    if qual_records is None:
+                        if not qual_src.exists():
+                            L.warning("Missing QUAL file for %s; skipping quality output for this source.", src)
+                            qual_missing = True
+                            continue
+                        qual_records = {rec.id: rec for rec in SeqIO.parse(qual_src, "qual")}
+                        if qual_out_handle is None:
+                            qual_out_handle = qual_out_path.open("w", encoding="utf-8")
+
+                    record_id = title.split(None, 1)[0] if title else ""
+                    qual_rec = qual_records.get(record_id)
+                    if qual_rec is None:
+                        raise ValueError(
+                            f"QUAL record missing for {record_id} in {qual_src}"
+                        )
+                    quals = qual_rec.letter_annotations.get("phred_quality", [])
+                    if len(quals) != len(seq):
+                        raise ValueError(
+                            f"Quality length mismatch for {record_id} in {qual_src}: "
+                            f"{len(quals)} != {len(seq)}"
+                        )
+                    qual_rec.description = ""
+                    SeqIO.write(qual_rec, qual_out_handle, "qual")
 
     if qual_out_handle is not None:
         qual_out_handle.close()
@@ -295,7 +311,7 @@ def write_process_logs(
     return stdout_path, stderr_path
 
 def assemble_pairs(input_dir: PathLike, output_dir: PathLike, *, dup_policy: DupPolicy = DupPolicy.ERROR, cap3_options: Sequence[str] | None = None, fwd_pattern: str | None = None, rev_pattern: str | None = None, pairing_report: PathLike | None = None, enforce_same_well: bool = False, well_pattern: str | re.Pattern[str] | None = None, 
-                   use_qual: bool = True, on_stage=None, on_progress=None, 
+                   use_qual: bool = True, threads: int | None = None, reuse: bool = False, on_stage=None, on_progress=None, 
                    ) -> list[Path]:
     """
     Run CAP3 assemblies for each forward and reverse pair discovered in ``input_dir``. 
@@ -313,6 +329,14 @@ def assemble_pairs(input_dir: PathLike, output_dir: PathLike, *, dup_policy: Dup
         See :class: `microseq_tests.assembly.pairing.DupPolicy`.
     cap3_options:
         Optional additional command-line arguments appended to CAP3 call. 
+    threads:
+        Maximum number of samples assembled concurrently. CAP3 is
+        single-threaded, so each worker runs one CAP3 process. Defaults to 1
+        (sequential).
+    reuse:
+        Keep an existing ``*.cap.contigs`` instead of re-running CAP3 when its stamp
+        matches this run: same source files (path, size, mtime), same CAP3 argv,
+        ``use_qual`` and merge/overlap settings. Off by default: every sample is assembled.
 
     Return:
     ------
@@ -348,6 +372,17 @@ def assemble_pairs(input_dir: PathLike, output_dir: PathLike, *, dup_policy: Dup
         high_conflict_action = "flag"
     cap3_validate_pair_support = bool(overlap_cfg.get("cap3_validate_pair_support", False))
     cap3_exe = cfg["tools"]["cap3"]
+    # Everything besides the sources and CAP3 argv that decides what a sample's contig looks like;
+    # stamped next to each contig so ``reuse`` never picks up output from different settings.
+    assembly_settings = {
+        "use_qual": use_qual,
+        "cap3_validate_pair_support": cap3_validate_pair_support,
+        "overlap_eval": [merge_min_overlap, merge_min_identity, merge_min_quality, quality_mode,
+                         ambiguity_identity_delta, ambiguity_quality_epsilon,
+                         high_conflict_q_threshold, high_conflict_action],
+        "merge_two_reads": [merge_overlap_engine, merge_overlap_engine_strategy,
+                            merge_overlap_engine_order, merge_anchor_tolerance_bases],
+    }
 
     in_dir = Path(input_dir).resolve() 
     out_dir = Path(output_dir).resolve() 
@@ -450,211 +485,224 @@ def assemble_pairs(input_dir: PathLike, output_dir: PathLike, *, dup_policy: Dup
         # Exit out since nothing here to do 
         return []
 
-    total_tasks = 0 
-    for _sid, _entries in sorted(pairs.items()):
-        if dup_policy == DupPolicy.KEEP_SEPARATE:
-            total_tasks += len(_build_keep_separate_pairs(_as_path_list(_entries["F"]), _as_path_list(_entries["R"])))
-        else:
-            total_tasks += 1 
-    total_tasks = max(1, total_tasks)
-    done_tasks = 0 
-    heartbeat_interval = 5 
-    on_stage("Paired assembly")
-    on_progress(0) 
-    
-    # goign to collect the samples started with an empty list 
-    contig_paths: list[Path] = [] 
-    # Will process the ordered sampled paired list one by one 
+    # Build every (sample_key, sources, fwd, rev) task up front so the CAP3 runs can be
+    # scheduled independently; contig/metadata order still follows sorted(pairs).
+    tasks: list[tuple[str, list[Path], Path | None, Path | None]] = []
     for sid in sorted(pairs):
         # Find the location of the orientation based on the file name 
         entries = pairs[sid]
+        f_sources = _as_path_list(entries["F"])
+        r_sources = _as_path_list(entries["R"])
 
-        tasks: list[tuple[str, list[Path], Path | None, Path | None]] = [] 
         if dup_policy == DupPolicy.KEEP_SEPARATE:
-            f_sources = _as_path_list(entries["F"])
-            r_sources = _as_path_list(entries["R"])
             primer_pairs = _build_keep_separate_pairs(f_sources, r_sources)
+            if not primer_pairs:
+                raise RuntimeError("pairing produced no tasks")
             for idx, (fwd, rev) in enumerate(primer_pairs, start=1):
                 sample_key = sid if len(primer_pairs) == 1 else f"{sid}_{idx}"
                 tasks.append((sample_key, [fwd, rev], fwd, rev))
         else:
-            f_sources = _as_path_list(entries["F"])
-            r_sources = _as_path_list(entries["R"])
-            sources = list(_iter_paths(entries["F"])) + list(_iter_paths(entries["R"]))
+            sources = f_sources + r_sources
             fwd_path = f_sources[0] if len(f_sources) == 1 else None
             rev_path = r_sources[0] if len(r_sources) == 1 else None
             tasks.append((sid, sources, fwd_path, rev_path))
 
-        if not tasks:
-            raise RuntimeError("pairing produced no tasks")
+    total_tasks = max(1, len(tasks))
+    done_tasks = 0 
+    heartbeat_interval = 5 
+    max_workers = max(1, int(threads or 1))
+    on_stage("Paired assembly")
+    on_progress(0) 
 
-        for sample_key, sources, fwd_path, rev_path in tasks: 
-            sample_dir = out_dir / sample_key 
-            sample_dir.mkdir(parents=True, exist_ok=True) 
-            sample_fasta = sample_dir / f"{sample_key}_paired.fasta" 
+    def _tick() -> None:
+        nonlocal done_tasks
+        done_tasks += 1 
+        if done_tasks % heartbeat_interval == 0 or done_tasks == total_tasks:
+            heartbeat = f"Paired assembly: {done_tasks}/{total_tasks} complete"
+            L.info(heartbeat)
+            on_stage(heartbeat)
+        on_progress(int(done_tasks * 100 / total_tasks)) 
+
+    def _run_task(sample_key: str, sources: list[Path], fwd_path: Path | None, rev_path: Path | None) -> tuple[list[str], Path | None]:
+        """Assemble one task; return its metadata lines and contig path (None when no contig is kept)."""
+        task_lines: list[str] = []
+        sample_dir = out_dir / sample_key 
+        sample_dir.mkdir(parents=True, exist_ok=True) 
+        sample_fasta = sample_dir / f"{sample_key}_paired.fasta" 
+        cached_contig = sample_dir / f"{sample_key}_paired.fasta.cap.contigs"
+        cmd = [cap3_exe, sample_fasta.name]
+        if cap3_options:
+            cmd.extend(cap3_options)
+        # sibling .qual files feed both the combined QUAL (use_qual) and merge_two_reads, so they
+        # are stamped too; recording the missing ones makes adding/removing a .qual invalidate it
+        qual_paths = [Path(f"{src}.qual") for src in sources]
+        stamp = run_stamp(
+            sources + [q for q in qual_paths if q.exists()],
+            argv=cmd,
+            missing_qual=sorted(str(q.resolve()) for q in qual_paths if not q.exists()),
+            **assembly_settings,
+        )
+        if reuse and is_up_to_date(cached_contig, stamp):
+            L.info("CAP3 contigs for %s up to date; skipping assembly: %s", sample_key, cached_contig)
+            task_lines.append(f"{sample_key}\treused_existing_contigs\t\t")
+            return task_lines, cached_contig
+        clear_stamp(cached_contig) # anything produced from here on is re-stamped only once it is kept
 
-            _write_combined_fasta(sources, sample_fasta, use_qual=use_qual) 
+        _write_combined_fasta(sources, sample_fasta, use_qual=use_qual) 
 
-            if fwd_path and rev_path and len(sources) == 2:
-                try:
-                    contig_path, report = merge_two_reads(
-                        sample_id=sample_key,
-                        fwd_path=fwd_path,
-                        rev_path=rev_path,
-                        output_dir=sample_dir,
-                        min_overlap=merge_min_overlap,
-                        min_identity=merge_min_identity,
-                        min_quality=merge_min_quality,
-                        quality_mode=quality_mode,
-                        ambiguity_identity_delta=ambiguity_identity_delta,
-                        ambiguity_quality_epsilon=ambiguity_quality_epsilon,
-                        high_conflict_q_threshold=high_conflict_q_threshold,
-                        high_conflict_action=high_conflict_action,
-                        overlap_engine=merge_overlap_engine,
-                        overlap_engine_strategy=merge_overlap_engine_strategy,
-                        overlap_engine_order=merge_overlap_engine_order if isinstance(merge_overlap_engine_order, list) else None,
-                        anchor_tolerance_bases=merge_anchor_tolerance_bases,
-                    )
-                except MergeInputError as exc:
-                    L.warning("Skipping merge_two_reads for %s: %s", sample_key, exc)
-                    metadata_lines.append(
-                        f"{sample_key}\tmerge_two_reads_skipped_non_singleton "
-                        f"f_n={exc.f_count if exc.f_count is not None else 'na'} "
-                        f"r_n={exc.r_count if exc.r_count is not None else 'na'} reason={exc}"
-                    )
-                else:
-                    metadata_lines.append(
-                        f"{sample_key}\tmerge_two_reads engine={report.overlap_engine} "
-                        f"strategy={merge_overlap_engine_strategy} order={merge_overlap_engine_order} "
-                        f"orientation={report.orientation} overlap={report.overlap_len} identity={report.identity:.4f}"
-                    )
-                    if contig_path:
-                        L.info(
-                            "Paired assembler path for %s: merge_two_reads accepted (%s)",
-                            sample_key,
-                            report.merge_status,
-                        )
-                        contig_paths.append(contig_path)
-                        done_tasks += 1 
-                        if done_tasks % heartbeat_interval == 0 or done_tasks == total_tasks:
-                            heartbeat = f"Paired assembly: {done_tasks}/{total_tasks} complete"
-                            L.info(heartbeat)
-                            on_stage(heartbeat)
-                        on_progress(int(done_tasks * 100 / total_tasks))
-                        continue
+        if fwd_path and rev_path and len(sources) == 2:
+            try:
+                contig_path, report = merge_two_reads(
+                    sample_id=sample_key,
+                    fwd_path=fwd_path,
+                    rev_path=rev_path,
+                    output_dir=sample_dir,
+                    min_overlap=merge_min_overlap,
+                    min_identity=merge_min_identity,
+                    min_quality=merge_min_quality,
+                    quality_mode=quality_mode,
+                    ambiguity_identity_delta=ambiguity_identity_delta,
+                    ambiguity_quality_epsilon=ambiguity_quality_epsilon,
+                    high_conflict_q_threshold=high_conflict_q_threshold,
+                    high_conflict_action=high_conflict_action,
+                    overlap_engine=merge_overlap_engine,
+                    overlap_engine_strategy=merge_overlap_engine_strategy,
+                    overlap_engine_order=merge_overlap_engine_order if isinstance(merge_overlap_engine_order, list) else None,
+                    anchor_tolerance_bases=merge_anchor_tolerance_bases,
+                )
+            except MergeInputError as exc:
+                L.warning("Skipping merge_two_reads for %s: %s", sample_key, exc)
+                task_lines.append(
+                    f"{sample_key}\tmerge_two_reads_skipped_non_singleton "
+                    f"f_n={exc.f_count if exc.f_count is not None else 'na'} "
+                    f"r_n={exc.r_count if exc.r_count is not None else 'na'} reason={exc}"
+                )
+            else:
+                task_lines.append(
+                    f"{sample_key}\tmerge_two_reads engine={report.overlap_engine} "
+                    f"strategy={merge_overlap_engine_strategy} order={merge_overlap_engine_order} "
+                    f"orientation={report.orientation} overlap={report.overlap_len} identity={report.identity:.4f}"
+                )
+                if contig_path:
                     L.info(
-                        "Paired assembler path for %s: merge_two_reads=%s; fallback to CAP3",
+                        "Paired assembler path for %s: merge_two_reads accepted (%s)",
                         sample_key,
                         report.merge_status,
                     )
-                    if report.merge_status == "quality_low" and quality_mode == "blocking":
-                        L.info(
-                            "Paired assembler path for %s: quality_mode=blocking keeps singlets, CAP3 skipped",
-                            sample_key,
-                        )
-                        done_tasks += 1 
-                        if done_tasks % heartbeat_interval == 0 or done_tasks == total_tasks:
-                            heartbeat = f"Paired assembly: {done_tasks}/{total_tasks} complete"
-                            L.info(heartbeat)
-                            on_stage(heartbeat)
-                        on_progress(int(done_tasks * 100 / total_tasks)) 
-                        continue
-
-            if not (fwd_path and rev_path and len(sources) == 2):
+                    return task_lines, contig_path
                 L.info(
-                    "Paired assembler path for %s: merge_two_reads unavailable (non-singleton or missing pair); using CAP3",
+                    "Paired assembler path for %s: merge_two_reads=%s; fallback to CAP3",
                     sample_key,
+                    report.merge_status,
                 )
-            cmd = [cap3_exe, sample_fasta.name]
-            if cap3_options:
-                cmd.extend(cap3_options)
-            L.info("Run CAP3 (apired) %s: %s", sample_key, " ".join(cmd))
+                if report.merge_status == "quality_low" and quality_mode == "blocking":
+                    L.info(
+                        "Paired assembler path for %s: quality_mode=blocking keeps singlets, CAP3 skipped",
+                        sample_key,
+                    )
+                    return task_lines, None
 
-            metadata_lines.append(
-                f"{sample_key}\t{' '.join(cmd)}\t\t"
+        if not (fwd_path and rev_path and len(sources) == 2):
+            L.info(
+                "Paired assembler path for %s: merge_two_reads unavailable (non-singleton or missing pair); using CAP3",
+                sample_key,
             )
+        L.info("Run CAP3 (apired) %s: %s", sample_key, " ".join(cmd))
+
+        # Header-only logs first; CAP3 then streams straight into them so its (often large)
+        # stdout/stderr never sits in memory, and only a bounded tail is echoed to the logger.
+        stdout_path, stderr_path = write_cap3_process_logs(
+            cap3_logs_dir,
+            sample_id=sample_key,
+            command=cmd,
+            assembler_label="cap3_default",
+            stdout_text="",
+            stderr_text="",
+        )
+        task_lines.append(f"{sample_key}\t{' '.join(cmd)}\t{stdout_path}\t{stderr_path}")
+        stderr_start = stderr_path.stat().st_size
 
+        with stdout_path.open("a", encoding="utf-8") as out_fh, stderr_path.open("a", encoding="utf-8") as err_fh:
             try:
-                result = subprocess.run(
+                subprocess.run(
                     cmd, 
                     check=True,
                     cwd=sample_dir,
-                    capture_output=True,
-                    text=True,
-                )
-                if result.stdout:
-                    L.info("CAP3 stdout for %s:\n%s", sample_key, result.stdout)
-                if result.stderr:
-                    L.warning("CAP3 stderr for %s:\n%s", sample_key, result.stderr)
-                stdout_path, stderr_path = write_cap3_process_logs(
-                    cap3_logs_dir,
-                    sample_id=sample_key,
-                    command=cmd,
-                    assembler_label="cap3_default",
-                    stdout_text=result.stdout or "",
-                    stderr_text=result.stderr or "",
+                    stdout=out_fh,
+                    stderr=err_fh,
                 )
-                metadata_lines[-1] = f"{sample_key}\t{' '.join(cmd)}\t{stdout_path}\t{stderr_path}"
             except subprocess.CalledProcessError as exc:
-                stdout_path, stderr_path = write_cap3_process_logs(
-                    cap3_logs_dir,
-                    sample_id=sample_key,
-                    command=cmd,
-                    assembler_label="cap3_default",
-                    stdout_text=exc.stdout or "",
-                    stderr_text=exc.stderr or "",
-                )
-                metadata_lines[-1] = f"{sample_key}\t{' '.join(cmd)}\t{stdout_path}\t{stderr_path}"
+                exc.stderr = _read_log_tail(stderr_path, stderr_start)
                 L.error("CAP3 failed for sample %s (exit %s):\n%s", sample_key, exc.returncode, exc.stderr
                 )
-                if exc.stdout:
-                    L.error("CAP3 stdout for %s:\n%s", sample_key, exc.stdout)
+                L.error("CAP3 stdout for %s: %s", sample_key, stdout_path)
                 raise # stop the run here on raise 
 
-            contig_path = sample_dir / f"{sample_key}_paired.fasta.cap.contigs"
-            if not contig_path.exists():
-                raise FileNotFoundError(contig_path)
-
-            if cap3_validate_pair_support and fwd_path and rev_path and len(sources) == 2:
-                validation = _validate_cap3_contig_support(contig_path, fwd_path, rev_path)
-                marker_path = sample_dir / f"{sample_key}_paired.cap3_validation.txt"
-                marker_path.write_text(f"{validation}\n", encoding="utf-8")
-                metadata_lines.append(f"{sample_key}	cap3_validation={validation}")
-
-                if validation == "rejected":
-                    L.warning("CAP3 output for %s rejected by ACE membership check; skipping contig", sample_key)
-                    singlets_path = sample_dir / f"{sample_key}_paired.fasta.cap.singlets"
-                    fwd_record = next(SeqIO.parse(fwd_path, "fasta"), None)
-                    rev_record = next(SeqIO.parse(rev_path, "fasta"), None)
-                    singlet_records = [rec for rec in (fwd_record, rev_record) if rec is not None]
-                    if singlet_records:
-                        SeqIO.write(singlet_records, singlets_path, "fasta")
-                    try:
-                        contig_path.unlink()
-                    except FileNotFoundError:
-                        pass
-                    done_tasks += 1 
-                    if done_tasks % heartbeat_interval == 0 or done_tasks == total_tasks:
-                        heartbeat = f"Paired assembly: {done_tasks}/{total_tasks} complete"
-                        L.info(heartbeat)
-                        on_stage(heartbeat)
-                    on_progress(int(done_tasks * 100 / total_tasks))
-                    continue
-                if validation == "unknown":
-                    L.warning(
-                        "CAP3 output for %s could not be validated (ACE missing/unreadable); keeping contig",
-                        sample_key,
-                    )
+        stderr_tail = _read_log_tail(stderr_path, stderr_start)
+        if stderr_tail:
+            L.warning("CAP3 stderr for %s:\n%s", sample_key, stderr_tail)
+        L.info("CAP3 stdout for %s: %s", sample_key, stdout_path)
+
+        contig_path = sample_dir / f"{sample_key}_paired.fasta.cap.contigs"
+        if not contig_path.exists():
+            raise FileNotFoundError(contig_path)
+
+        if cap3_validate_pair_support and fwd_path and rev_path and len(sources) == 2:
+            validation = _validate_cap3_contig_support(contig_path, fwd_path, rev_path)
+            marker_path = sample_dir / f"{sample_key}_paired.cap3_validation.txt"
+            marker_path.write_text(f"{validation}\n", encoding="utf-8")
+            task_lines.append(f"{sample_key}	cap3_validation={validation}")
+
+            if validation == "rejected":
+                L.warning("CAP3 output for %s rejected by ACE membership check; skipping contig", sample_key)
+                singlets_path = sample_dir / f"{sample_key}_paired.fasta.cap.singlets"
+                fwd_record = next(SeqIO.parse(fwd_path, "fasta"), None)
+                rev_record = next(SeqIO.parse(rev_path, "fasta"), None)
+                singlet_records = [rec for rec in (fwd_record, rev_record) if rec is not None]
+                if singlet_records:
+                    SeqIO.write(singlet_records, singlets_path, "fasta")
+                try:
+                    contig_path.unlink()
+                except FileNotFoundError:
+                    pass
+                return task_lines, None
+            if validation == "unknown":
+                L.warning(
+                    "CAP3 output for %s could not be validated (ACE missing/unreadable); keeping contig",
+                    sample_key,
+                )
+
+        write_stamp(contig_path, stamp)
+        L.info("Cap3 paired assembly finished for %s and for contigs: %s", sample_key, contig_path) 
+        return task_lines, contig_path
 
+    # CAP3 is single-threaded, so independent samples are run side by side (bounded by threads).
+    results: list[tuple[list[str], Path | None] | None] = [None] * len(tasks)
+    if max_workers == 1 or len(tasks) <= 1:
+        for idx, task in enumerate(tasks):
+            results[idx] = _run_task(*task)
+            _tick()
+    else:
+        future_map = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as ex:
+            for idx, task in enumerate(tasks):
+                future_map[ex.submit(_run_task, *task)] = idx
+            try:
+                for future in as_completed(future_map):
+                    results[future_map[future]] = future.result()
+                    _tick()
+            except BaseException:
+                # stop queued samples from starting once one of them has failed
+                for future in future_map:
+                    future.cancel()
+                raise
+
+    # goign to collect the samples in sorted task order 
+    contig_paths: list[Path] = [] 
+    for task_lines, contig_path in results:
+        metadata_lines.extend(task_lines)
+        if contig_path is not None:
             contig_paths.append(contig_path)
-            L.info("Cap3 paired assembly finished for %s and for contigs: %s", sample_key, contig_path) 
-
-            done_tasks += 1 
-            if done_tasks % heartbeat_interval == 0 or done_tasks == total_tasks:
-                heartbeat = f"Paired assembly: {done_tasks}/{total_tasks} complete"
-                L.info(heartbeat)
-                on_stage(heartbeat)
-            on_progress(int(done_tasks * 100 / total_tasks)) 
     
     metadata_path.write_text("\n".join(metadata_lines) + "\n", encoding="utf-8")
 
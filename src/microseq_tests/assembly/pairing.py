@@ -5,6 +5,8 @@ Main purpose is to scan a folder full of DNA sequence files which often come in
 """
 
 from __future__ import annotations # Postpones evaluation of type annotations (PEP 563) so they are no longer evaluated at function definition time - treated as string instead first 
+import functools
+import os
 import re # For regular expressions (text pattern matching) 
 from pathlib import Path # Handling file systems 
 import logging # Print warning messages 
@@ -12,7 +14,7 @@ from collections import defaultdict # Creating specialized dictionaries dealing
 from typing import Callable, Sequence, Union # FOr creating speicific type hints 
 from enum import Enum # Creating enumerable, constant values
 from dataclasses import dataclass 
-from Bio import SeqIO 
+from Bio.SeqIO.FastaIO import SimpleFastaParser
 
 # Inheriting from 'str' and "Enum" allows members to be compared directly to strings. For example, DupPolicy.Error = "error" will be True. 
 class DupPolicy(str, Enum):
@@ -30,31 +32,55 @@ Here creating a type alias named Detector It defines the blueprint for any funct
 Detector = Callable[[str], tuple[str, str | None]] # Calling a function ["string filename" and returning a tuple that has "string sampleID and F/R orientation OR None"  
 
 # ----------- Detectors ---------------------------
-# Pre-compiled regular expressions that will be used to find primer tokens within filenames automatically note I added re.I for case-insensitive. 
+# Pre-compiled regular expressions that will be used to find primer tokens within filenames automatically. Case-insensitivity is
+# spelled out in the character classes ([FRfr], [A-Ha-h]) instead of re.I so the engine never case-folds while scanning. 
 
 #_MID_RX: Finds a word like "_27F_" or "-1492R-" in the middle of a filename. 
-_MID_RX = re.compile(r"[_\-]([A-Za-z0-9]+[FR])[_\-]", re.I) 
+_MID_RX = re.compile(r"[_\-]([A-Za-z0-9]+[FRfr])[_\-]") 
 # _PREFIX_RX Finds a word like "27F_" or "1492R-" at the very start of filename.
-_PREFIX_RX = re.compile(r"^([A-Za-z0-9]+[FR])[_\-]", re.I) 
+_PREFIX_RX = re.compile(r"^([A-Za-z0-9]+[FRfr])[_\-]") 
 # _SUFFIX_RX Finds a word like "_27F.fasta" or "-1492R.fasta" at the end of a filename 
-_SUFFIX_RX = re.compile(r"[_\-]([A-Za-z0-9]+[FR])\.[^.]+$", re.I)
+_SUFFIX_RX = re.compile(r"[_\-]([A-Za-z0-9]+[FRfr])\.[^.]+$")
 # Match plate positions (A01-H12) that may sit next to dashes/underscores 
 # rather than relying on word boundaries 
-_WELL_RX = re.compile(r"(?i)(?<![A-Z0-9])([A-H](?:0?[1-9]|1[0-2]))(?![A-Z0-9])") 
+_WELL_RX = re.compile(r"(?<![A-Za-z0-9])([A-Ha-h](?:0?[1-9]|1[0-2]))(?![A-Za-z0-9])") 
 # Match an isolated well token (A01-H12) when splitting on separators. 
-_WELL_TOKEN_RK = re.compile(r"(?i)^[A-H](?:0?[1-9]|1[0-2])$") 
+_WELL_TOKEN_RK = re.compile(r"^[A-Ha-h](?:0?[1-9]|1[0-2])$") 
+# Separator runs used to split sample IDs into tokens 
+_SEP_RUN_RX = re.compile(r"[_-]+")
+# Characters not allowed in per-record temp FASTA filenames 
+_UNSAFE_ID_RX = re.compile(r"[^A-Za-z0-9_.-]+")
+_safe_id_sub = _UNSAFE_ID_RX.sub # bound once; called per record in the single-FASTA branch
+# Extensions accepted for a single multi-record FASTA input 
+_FASTA_EXTS = frozenset({".fasta", ".fa", ".fna"})
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_ci(pattern: str) -> re.Pattern[str]:
+    """Case-insensitive compile of a user-supplied pattern, memoized across calls and directories."""
+    return re.compile(pattern, re.I)
+
+def _stem(name: str) -> str:
+    """``Path(name).stem`` without building a Path; names with separators or odd dots defer to pathlib."""
+    if not name or name == "." or "/" in name or "\\" in name:
+        return Path(name).stem
+    i = name.rfind(".")
+    if i <= 0 or i == len(name) - 1:
+        return name
+    return name[:i]
 
 def mid_token_detector(name: str):
     """Detects primer tokens in the middle of a filename."""
     # Search the filename for the middle-token pattern. 
     if m := _MID_RX.search(name):
         # If a match is found, extract the token/word (e.g. "27F") and orientation ("F") plus convert always to uppercase to standardize. 
-        tok, orient = m[1], m[1][-1].upper() 
-        # The sample ID is assumed to be everything befoer the token.
-        sid = name.split(f"{tok}", 1)[0].rstrip("_-")
+        orient = m[1][-1].upper() 
+        # The sample ID is assumed to be everything befoer the token (sliced at the match, so an
+        # earlier copy of the token text such as the "F" in "Fecal1_F_x" cannot cut it short).
+        sid = name[:m.start(1)].rstrip("_-")
         return sid, orient 
     # If no match found, return the filename stem and None for orientation. 
-    return Path(name).stem, None 
+    return _stem(name), None 
 
 
 def prefix_detector(name: str):
@@ -62,17 +88,20 @@ def prefix_detector(name: str):
     # Match the filename for the prefix-token pattern I've set up 
     if m := _PREFIX_RX.match(name):
         # Extract the token (Primer name) and orientation 
-        tok, orient = m[1], m[1][-1].upper() 
+        orient = m[1][-1].upper() 
         # The sample ID is everything after the token (hence prefix = 1st) 
-        sid = name.split(f"{tok}", 1)[1].lstrip("_-").split(".",1)[0] 
+        sid = name[m.end(1):].lstrip("_-").split(".",1)[0] 
         return sid, orient 
     # If no match, return the default 
-    return Path(name).stem, None 
+    return _stem(name), None 
 
 def suffix_detector(name: str):
     """Detects primer tokens at the end of a filename"""
-    # Search the filename for the suffix pattern 
-    if m := _SUFFIX_RX.search(name):
+    # The token must run from the last separator up to the extension dot, so anchor the match
+    # there instead of letting search() retry at every position of the sample-id prefix 
+    dot = name.rfind(".")
+    sep = max(name.rfind("_", 0, dot), name.rfind("-", 0, dot)) if dot > 0 else -1
+    if sep >= 0 and (m := _SUFFIX_RX.match(name, sep)):
         # Extract the token (the primer name) and orientation
         tok = m[1] # example 27F or 1492R 
         orient = tok[-1].upper() # F or R    
@@ -80,7 +109,7 @@ def suffix_detector(name: str):
         sid = name[:m.start()].rstrip("_-") 
         return sid, orient 
     # If no match then return default (Just sample ID with no orient/token) 
-    return Path(name).stem, None 
+    return _stem(name), None 
 
 
 # This list acts as a registry for all available detector functions,
@@ -90,6 +119,39 @@ DETECTORS: list[Detector] = [
     prefix_detector,
     suffix_detector,
 ]
+# Frozen snapshot of the built-in detectors; the fused fast path below is only valid for exactly these,
+# so it is keyed on this tuple rather than on the (user-extensible) ``DETECTORS`` list.
+_BUILTIN_DETECTORS: tuple[Detector, ...] = (mid_token_detector, prefix_detector, suffix_detector)
+
+# All three default detectors fused into one anchored pattern. Each alternative is tried at
+# position 0 in registry order (mid, prefix, suffix), and the lazy ``.*?`` lookaheads find the
+# same leftmost token a per-detector ``search`` would, so one regex call replaces up to three.
+_DEFAULT_DETECTOR_RX = re.compile(
+    r"^(?:(?=.*?[_\-](?P<mid>[A-Za-z0-9]+[FRfr])[_\-])"
+    r"|(?P<prefix>[A-Za-z0-9]+[FRfr])[_\-]"
+    r"|(?=.*?[_\-](?P<suffix>[A-Za-z0-9]+[FRfr])\.[^.]+$))",
+    re.S,
+)
+
+
+@functools.lru_cache(maxsize=8192)
+def _default_detect(name: str) -> tuple[str, str | None, str | None]:
+    """Single-pass equivalent of running ``_BUILTIN_DETECTORS`` in order; returns (sid, orient, detector_name).
+
+    Memoized by name: a pipeline run re-scans the same folder for pairing, reports,
+    audits and BLAST inputs, so repeat lookups skip the regex entirely.
+    """
+    m = _DEFAULT_DETECTOR_RX.match(name)
+    if m is None:
+        return _stem(name), None, None
+    kind = m.lastgroup
+    orient = m[kind][-1].upper()
+    if kind == "mid":
+        return name[:m.start(kind)].rstrip("_-"), orient, mid_token_detector.__name__
+    if kind == "prefix":
+        return name[m.end(kind):].lstrip("_-").split(".", 1)[0], orient, prefix_detector.__name__
+    return name[:m.start(kind) - 1].rstrip("_-"), orient, suffix_detector.__name__
+
 
 SEQ_FILE_PATTERNS = ("*.fasta", "*.fastq", "*.ab1", "*.seq") 
 
@@ -101,6 +163,25 @@ def iter_seq_files(directory: Path) -> list[Path]:
         files.update(directory.rglob(pattern))
     return sorted(files)
 
+def _scan_fasta_files(directory: Path) -> list[Path]:
+    """Recursive ``*.fasta`` listing via ``os.scandir``; same files and order as FASTA hits from :func:`iter_seq_files`."""
+
+    found: list[Path] = []
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except PermissionError:
+            continue # rglob skips unreadable folders as well 
+        with it:
+            for entry in it:
+                # DirEntry caches the type from the directory listing, so no per-file stat here 
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".fasta") and entry.is_file():
+                    found.append(Path(entry.path))
+    return sorted(found)
+
 def _strip_token(name: str, token: str) -> str:
     """Remove token from name and tidy separators/extension."""
     base = name
@@ -112,37 +193,42 @@ def _strip_token(name: str, token: str) -> str:
     else:
         cleaned = base
 
-    return Path(cleaned).stem
+    return _stem(cleaned)
 
 
+@functools.lru_cache(maxsize=128)
 def make_pattern_detector(fwd_pattern: str, rev_pattern: str) -> Detector:
-    """Build a detector that searches for custom forward/reverse regex tokens."""
+    """Build a detector that searches for custom forward/reverse regex tokens.
+
+    Cached per ``(fwd_pattern, rev_pattern)``; the returned closure holds no state.
+    """
 
-    fwd_rx = re.compile(f"({fwd_pattern})", re.I)
-    rev_rx = re.compile(f"({rev_pattern})", re.I)
+    fwd_rx = _compile_ci("(" + fwd_pattern + ")")
+    rev_rx = _compile_ci("(" + rev_pattern + ")")
 
     def detector(name: str) -> tuple[str, str | None]:
         if m := fwd_rx.search(name):
-            token = m[1]
-            sid = name.split(token, 1)[0].rstrip("_-")
-            return sid or Path(name).stem, "F"
+            sid = name[:m.start(1)].rstrip("_-")
+            return sid or _stem(name), "F"
         if m := rev_rx.search(name):
-            token = m[1]
-            sid = name.split(token, 1)[0].rstrip("_-")
-            return sid or Path(name).stem, "R" 
-        return Path(name).stem, None
+            sid = name[:m.start(1)].rstrip("_-")
+            return sid or _stem(name), "R" 
+        return _stem(name), None
 
     return detector
 
+def _resolve_well_rx(pattern: str | re.Pattern[str] | None) -> re.Pattern[str]:
+    """Return the compiled well regex for ``pattern`` (default A01-H12 matcher when None)."""
+    if pattern is None:
+        return _WELL_RX
+    if isinstance(pattern, str):
+        return _compile_ci(pattern)
+    return pattern 
+
 def _extract_well(name: str, *, pattern: str | re.Pattern[str] | None = None) -> str | None: 
     """ Return a normalized plate well code (example "A07") if present."""
 
-    if pattern is None:
-        rx = _WELL_RX
-    elif isinstance(pattern, str):
-        rx = re.compile(pattern, re.I)
-    else:
-        rx = pattern 
+    rx = pattern if isinstance(pattern, re.Pattern) else _resolve_well_rx(pattern)
 
     if m := rx.search(name):
         raw = m[1]
@@ -154,7 +240,7 @@ def _extract_well(name: str, *, pattern: str | re.Pattern[str] | None = None) ->
 def _strip_well_token(sid: str, *, pattern: re.Pattern[str] = _WELL_TOKEN_RK) -> str:
     """Remove standalone well positions (A01-H12) from sample IDs when pairing.""" 
 
-    parts = re.split(r"[_-]+", sid)
+    parts = _SEP_RUN_RX.split(sid)
     kept = [p for p in parts if not pattern.fullmatch(p)] 
     cleaned = "_".join(filter(None, kept))
     return cleaned or sid 
@@ -205,8 +291,8 @@ def analyze_pairing_candidates(
     if fwd_pattern and rev_pattern:
         detectors = [make_pattern_detector(fwd_pattern, rev_pattern), *detectors]
 
-    fwd_rx = re.compile(f"({fwd_pattern})", re.I) if fwd_pattern else None
-    rev_rx = re.compile(f"({rev_pattern})", re.I) if rev_pattern else None
+    fwd_rx = _compile_ci(f"({fwd_pattern})") if fwd_pattern else None
+    rev_rx = _compile_ci(f"({rev_pattern})") if rev_pattern else None
     token_rx = None
     if not (fwd_rx or rev_rx) and known_tokens:
         escaped = "|".join(
@@ -215,8 +301,8 @@ def analyze_pairing_candidates(
             if tok
         )
         if escaped:
-            token_rx = re.compile(f"({escaped})", re.I)
-    well_rx = _WELL_RX if well_pattern is None else well_pattern
+            token_rx = _compile_ci(f"({escaped})")
+    well_rx = _resolve_well_rx(well_pattern) # compiled once, not per file
 
     candidates: list[PairingCandidate] = []
     sid_wells: dict[str, set[str]] = defaultdict(set)
@@ -279,27 +365,80 @@ def analyze_pairing_candidates(
 # --------------- Public Helpers ---------------------------
 def extract_sid_orientation(name: str, *, detectors: Sequence[Detector] | None = None) -> tuple[str, str | None]: 
     """Try each detector until one recognises a primer token."""
-    active_detectors = detectors or DETECTORS
-
-    for det in active_detectors: 
-        sid, orient = det(name)
-        if orient in ("F", "R"):
-            return sid, orient
-    # Loop exhausted -> no primer recognized 
-    return Path(name).stem, None 
+    sid, orient, _det_name = _detect_sid_orientation(name, detectors or DETECTORS)
+    return sid, orient 
 
 def _detect_sid_orientation(
     name: str, detectors: Sequence[Detector]
 ) -> tuple[str, str | None, str | None]:
     """Return (sid, orientation, detector_name) for the first detector that matches."""
 
-    for det in detectors:
+    # When the untouched built-ins close out the list (the usual case), run them as one fused regex.
+    # An extended or replaced registry no longer ends in exactly these three, so it takes the loop.
+    n_custom = len(detectors) - len(_BUILTIN_DETECTORS)
+    fused = n_custom >= 0 and tuple(detectors[n_custom:]) == _BUILTIN_DETECTORS
+    custom = detectors[:n_custom] if fused else detectors
+
+    for det in custom:
         sid, orient = det(name)
         if orient in ("F", "R"):
             det_name = getattr(det, "__name__", det.__class__.__name__)
             return sid, orient, det_name
 
-    return Path(name).stem, None, None
+    if fused:
+        return _default_detect(name)
+
+    return _stem(name), None, None
+
+# ----------- Duplicate handlers -------------------
+# One function per DupPolicy, looked up once in group_pairs; each is called only when
+# ``orient`` is already filled for ``key``. ``pairs``/``meta`` are flat dicts keyed by
+# ``(key, orient)`` / ``(key, field)`` while scanning and are nested only at the end.
+
+def _set_entry(pairs: dict, meta: dict, key: str, orient: str, path: Path, detector_name: str | None, well: str | None) -> None:
+    pairs[key, orient] = path
+    meta[key, orient] = detector_name or "unknown"
+    if well:
+        meta[key, f"well_{orient}"] = well 
+
+def _dup_error(pairs: dict, meta: dict, key: str, sid: str, orient: str, path: Path, detector_name: str | None, well: str | None) -> None:
+    raise ValueError(f"Duplicate {orient} read for sample {sid}: found {path} but {pairs[key, orient]} already exists.")
+
+def _dup_keep_first(pairs: dict, meta: dict, key: str, sid: str, orient: str, path: Path, detector_name: str | None, well: str | None) -> None:
+    logging.warning("Duplicate %s/%s ignored due to 'keep-first' policy: %s", sid, orient, path)
+
+def _dup_keep_last(pairs: dict, meta: dict, key: str, sid: str, orient: str, path: Path, detector_name: str | None, well: str | None) -> None:
+    logging.warning("Duplicate %s/%s overwriting previous entry %s due to 'keep-last' policy.", sid, orient, pairs[key, orient])
+    _set_entry(pairs, meta, key, orient, path, detector_name, well)
+
+def _dup_append(pairs: dict, meta: dict, key: str, sid: str, orient: str, path: Path, detector_name: str | None, well: str | None) -> None:
+    # promoted to a list on the first duplicate; later duplicates append in place
+    bucket = pairs[key, orient]
+    if type(bucket) is list:
+        bucket.append(path)
+    else:
+        pairs[key, orient] = [bucket, path]
+    meta_bucket = meta[key, orient]
+    if type(meta_bucket) is list:
+        meta_bucket.append(detector_name or "unknown")
+    else:
+        meta[key, orient] = [meta_bucket, detector_name or "unknown"]
+    if well:
+        wells = meta.get((key, f"well_{orient}"))
+        if wells is None:
+            meta[key, f"well_{orient}"] = [well] 
+        elif type(wells) is list:
+            wells.append(well)
+        else:
+            meta[key, f"well_{orient}"] = [wells, well] 
+
+_DUP_HANDLERS: dict[DupPolicy, Callable[..., None]] = {
+    DupPolicy.ERROR: _dup_error,
+    DupPolicy.KEEP_FIRST: _dup_keep_first,
+    DupPolicy.KEEP_LAST: _dup_keep_last,
+    DupPolicy.MERGE: _dup_append,
+    DupPolicy.KEEP_SEPARATE: _dup_append,
+}
 
 def group_pairs(
     folder: Union[str, Path], 
@@ -309,18 +448,17 @@ def group_pairs(
     """
     Groups Forward/Reverse reads from a folder into pairs 
     """
-    # Special dictionary will automatically create a nested dictionary 
-    # first time a new sample ID (sid) is encountered.
+    # Entries are collected in flat (sid, orientation) buckets and nested at the end.
     """
-    # how it looks like:
+    # how the returned mapping looks like:
     # {
   'SampleA': {  # Outer key (str)
     'F': Path('/path/to/file_F.fasta'),  # Inner key (str) and value (Path)
     'R': Path('/path/to/file_R.fasta')
   },
    """ 
-    pairs: dict[str, dict[str, Union[Path, list[Path]]]] = defaultdict(dict)
-    meta: dict[str, dict[str, Union[str, list[str]]]] = defaultdict(dict)
+    pairs: dict[tuple[str, str], Union[Path, list[Path]]] = {} # flat (key, orient) buckets while scanning 
+    meta: dict[tuple[str, str], Union[str, list[str]]] = {}
      
     active_detectors: Sequence[Detector]
     if detectors is not None:
@@ -330,92 +468,54 @@ def group_pairs(
     else:
         active_detectors = DETECTORS
 
-    well_rx = _WELL_RX if well_pattern is None else well_pattern 
-
-    def _store_entry(key: str, sid: str, orient: str, path: Path, detector_name: str | None, well: str | None) -> None:
-        bucket = pairs[key].get(orient)
-        meta_bucket = meta[key].get(orient)
-
-        if bucket is None:
-            pairs[key][orient] = path
-            meta[key][orient] = detector_name or "unknown"
-            if well:
-                meta[key][f"well_{orient}"] = well 
-            return
-
-        if dup_policy == DupPolicy.ERROR:
-            raise ValueError(f"Duplicate {orient} read for sample {sid}: found {path} but {bucket} already exists.")
-
-        if dup_policy == DupPolicy.KEEP_FIRST:
-            logging.warning("Duplicate %s/%s ignored due to 'keep-first' policy: %s", sid, orient, path)
-            return
-
-        if dup_policy == DupPolicy.KEEP_LAST:
-            logging.warning("Duplicate %s/%s overwriting previous entry %s due to 'keep-last' policy.", sid, orient, bucket)
-            pairs[key][orient] = path
-            meta[key][orient] = detector_name or "unknown"
-            if well:
-                meta[key][f"well_{orient}"] = well 
-            return
-
-        if dup_policy in (DupPolicy.MERGE, DupPolicy.KEEP_SEPARATE):
-            lst = bucket if isinstance(bucket, list) else [bucket]
-            lst.append(path)
-            pairs[key][orient] = lst
-            meta_lst = meta_bucket if isinstance(meta_bucket, list) else [meta_bucket]
-            meta_lst.append(detector_name or "unknown")
-            meta[key][orient] = meta_lst
-            if well:
-                wells = meta[key].get(f"well_{orient}")
-                if wells is None:
-                    meta[key][f"well_{orient}"] = [well] 
-                elif isinstance(wells, list):
-                    wells.append(well)
-                else:
-                    meta[key][f"well_{orient}"] = [wells, well] 
+    well_rx = _resolve_well_rx(well_pattern) # compiled once, not per file
 
+    on_duplicate = _DUP_HANDLERS[DupPolicy(dup_policy)] # policy resolved once, not per file 
 
     path = Path(folder)
-    fasta_exts = {".fasta", ".fa", ".fna"}
 
     missing_well: list[str] = []
+    # single-FASTA input: per-record text keyed by its temp path, so only paired winners hit the disk
+    pending_records: dict[Path, str] = {}
 
     if path.is_file():
-        if path.suffix.lower() not in fasta_exts:
+        if path.suffix.lower() not in _FASTA_EXTS:
             raise ValueError(f"Unsupported FASTA input: {path}")
   
         record_counts: dict[tuple[str, str], int] = defaultdict(int)
         tmp_dir = path.parent / f".{path.stem}_paired_records"
         tmp_dir.mkdir(parents=True, exist_ok=True)
 
-        for record in SeqIO.parse(path, "fasta"):
-            sid, orient, det_name = _detect_sid_orientation(record.id, active_detectors) 
-            if orient in ("F", "R") and not enforce_same_well:
-                sid = _strip_well_token(sid)
-            if orient not in ("F", "R"): 
-                continue
-            # if well is missing doc it 
-            well = _extract_well(record.id, pattern=well_rx) if enforce_same_well else None 
-            if enforce_same_well and not well:
-                missing_well.append(record.id)
-                continue 
-
-            record_counts[(sid, orient)] += 1
-            rec_idx = record_counts[(sid, orient)]
-            safe_id = re.sub(r"[^A-Za-z0-9_.-]+", "_", record.id)
-            rec_path = tmp_dir / f"{safe_id}_{rec_idx}.fasta"
-            SeqIO.write([record], rec_path, "fasta")
-            key = _pair_key(sid, well, enforce_same_well) 
-            _store_entry(key,sid, orient, rec_path, det_name, well)
-
-    if path.is_dir(): 
-        for p in iter_seq_files(path):
-            # Only process FASTA inputs here; other inputs must be converted upstream.
-            # Check the file extension in a case-insensitive way.
-            # If it's not a recognized FASTA extension, skip to the next file.
-            if p.suffix.lower() not in fasta_exts:
-                continue
+        # raw (title, seq) tuples: no SeqRecord objects or SeqIO writer per record 
+        with path.open("r", encoding="utf-8") as fasta_fh:
+            for title, seq in SimpleFastaParser(fasta_fh):
+                record_id = title.split(None, 1)[0] if title else ""
+                sid, orient, det_name = _detect_sid_orientation(record_id, active_detectors) 
+                if orient in ("F", "R") and not enforce_same_well:
+                    sid = _strip_well_token(sid)
+                if orient not in ("F", "R"): 
+                    continue
+                # if well is missing doc it 
+                well = _extract_well(record_id, pattern=well_rx) if enforce_same_well else None 
+                if enforce_same_well and not well:
+                    missing_well.append(record_id)
+                    continue 
+
+                count_key = (sid, orient) # one key tuple for both the read and the write 
+                rec_idx = record_counts[count_key] + 1
+                record_counts[count_key] = rec_idx
+                safe_id = _safe_id_sub("_", record_id)
+                rec_path = tmp_dir / f"{safe_id}_{rec_idx}.fasta"
+                pending_records[rec_path] = f">{title}\n{seq}\n" # written once pairing is settled
+                key = _pair_key(sid, well, enforce_same_well) 
+                if (key, orient) not in pairs:
+                    _set_entry(pairs, meta, key, orient, rec_path, det_name, well)
+                else:
+                    on_duplicate(pairs, meta, key, sid, orient, rec_path, det_name, well)
 
+    elif path.is_dir(): 
+        # Only process FASTA inputs here; other inputs must be converted upstream.
+        for p in _scan_fasta_files(path):
             # Get the sample ID and orientation ('F', 'R', or None)
             sid, orient, det_name = _detect_sid_orientation(p.name, detectors=active_detectors)
             if orient in ("F", "R") and not enforce_same_well:
@@ -431,13 +531,30 @@ def group_pairs(
                 continue 
 
             key = _pair_key(sid, well, enforce_same_well)
-            _store_entry(key, sid, orient, p, det_name, well) 
+            # stored inline rather than via a helper closure: this runs once per file 
+            if (key, orient) not in pairs:
+                _set_entry(pairs, meta, key, orient, p, det_name, well)
+            else:
+                on_duplicate(pairs, meta, key, sid, orient, p, det_name, well) 
     else:
         raise ValueError(f"Input path must be a FASTA file or directory: {path}")
 
+    # Nest the flat buckets back into {sid: {"F": ..., "R": ...}} in first-seen order
+    nested: dict[str, dict[str, Union[Path, list[Path]]]] = {}
+    for (key, orient), value in pairs.items():
+        nested.setdefault(key, {})[orient] = value
+
         # Finally filtering pairs keeping sample IDs ('s') have "F' and "R' keys
-    paired_only = {s: d for s, d in pairs.items() if {"F", "R"} <= d.keys()}
-    meta_only = {s: meta[s] for s in paired_only}
+    paired_only = {s: d for s, d in nested.items() if "F" in d and "R" in d}
+    meta_only: dict[str, dict[str, Union[str, list[str]]]] = {s: {} for s in paired_only}
+    if pending_records:
+        for entry in paired_only.values():
+            for value in entry.values():
+                for rec_path in value if isinstance(value, list) else (value,):
+                    rec_path.write_text(pending_records[rec_path], encoding="utf-8")
+    for (key, field), value in meta.items():
+        if key in meta_only:
+            meta_only[key][field] = value
     if enforce_same_well and missing_well:
         meta_only["_missing_well"] = {"files": missing_well}
 
@@ -1,6 +1,6 @@
 # -- src/microseq_tests/blast/run_blast.py ---------------
 from __future__ import annotations
-import logging, os, subprocess, shutil, re, functools, threading, time, sys
+import logging, os, subprocess, shutil, re, functools, threading, time, sys, mmap
 try:
     from PySide6.QtCore import QThread
 except Exception:  # allow running without Qt
@@ -10,8 +10,9 @@ except Exception:  # allow running without Qt
             return None
 from pathlib import Path 
 from typing import Optional, Callable 
-from Bio import SeqIO 
+from Bio.SeqIO.QualityIO import FastqGeneralIterator
 from microseq_tests.utility.utils import load_config, expand_db_path
+from microseq_tests.utility.io_utils import append_file_bytes
 from microseq_tests.utility.progress import _tls # access to parent progress bar 
 import pandas as pd
 from microseq_tests.utility.id_normaliser import NORMALISERS
@@ -100,22 +101,80 @@ def _build_empty_query_hint(query_path: Path) -> str:
     )
     return " | ".join(hint_lines)
 
+def _count_fasta_records(path: Path) -> int:
+    """Count FASTA headers (line-leading '>') with an mmap byte scan - no record parsing."""
+    if path.stat().st_size == 0:
+        return 0 # mmap refuses empty files
+    with path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm[:4096].lstrip()[:1] == b"@":
+            return 0 # FASTQ - quality lines may start with '>' too
+        n = 1 if mm[:1] == b">" else 0
+        pos = mm.find(b"\n>")
+        while pos != -1:
+            n += 1
+            pos = mm.find(b"\n>", pos + 2)
+    return n
+
+_STDOUT_CHUNK = 1 << 16
+
+def _count_data_rows(block: bytes) -> int:
+    """Count lines in *block* that are not '#' banner lines (block starts at a line boundary)."""
+    n = block.count(b"\n") - block.count(b"\n#") - block.startswith(b"#")
+    if block and not block.endswith(b"\n"):
+        n += 1 # unterminated last line
+    return n
+
+def _fasta_ids(path: Path) -> set[str]:
+    """Collect record IDs (header text up to the first whitespace) from '>' lines without parsing sequences."""
+    ids: set[str] = set()
+    with path.open("rb") as fh:
+        for line in fh:
+            if line[:1] == b">":
+                head = line[1:].split(None, 1)
+                ids.add(head[0].decode() if head else "")
+    return ids
+
+def _count_fastq_records(path: Path) -> int:
+    """Count FASTQ records from raw (title, seq, qual) string tuples - no SeqRecord or quality decoding."""
+    with path.open("r") as fh:
+        return sum(1 for _ in FastqGeneralIterator(fh))
+
+# SILVA accession prefix ("JN193283.1.1400 ") left in front of the taxon name
+_SILVA_PREFIX_RX = re.compile(r"^[A-Z]{1,4}\d{5,8}(?:\.\d+){0,2}\s+")
+
+def _clean_stitle_row(line: str) -> str:
+    """Reduce the trailing stitle column of one outfmt-6 row to the bare taxon name."""
+    head, sep, stitle = line.rstrip("\n").rpartition("\t")
+    stitle = stitle.rpartition("|")[2].lstrip(">").strip() # drop gi|...|ref|.... and stray '>'
+    return f"{head}{sep}{_SILVA_PREFIX_RX.sub('', stitle, count=1)}\n"
+
 # progress helper: tail the temporary TSV once per second
 def _progress_tail(tmp_path: Path, total: int, callback):
     """Background reader that counts unique qseqid already written."""
-    seen: set[str] = set()
-    while not getattr(_progress_tail, "stop", False):
-        if tmp_path.exists():
-            with tmp_path.open() as fh:
-                for ln in fh:
-                    if ln.startswith("#") or not ln:
+    seen: set[bytes] = set()
+    partial = b"" # trailing half-written row carried to the next poll
+    fh = None # opened once BLAST creates the file, then only read from where it left off
+    last_pct = -1
+    try:
+        while not getattr(_progress_tail, "stop", False):
+            if fh is None and tmp_path.exists():
+                fh = tmp_path.open("rb")
+            if fh is not None:
+                block = partial + fh.read()
+                cut = block.rfind(b"\n") + 1
+                partial = block[cut:]
+                for ln in block[:cut].splitlines():
+                    if ln.startswith(b"#") or not ln:
                         continue
-                    qseqid = ln.split("\t", 1)[0]
-                    seen.add(qseqid)
-        if callback:
-            pct = int(len(seen) / total * 100)
-            callback(min(pct, 99))
-        time.sleep(1)
+                    seen.add(ln.split(b"\t", 1)[0])
+            pct = len(seen) * 100 // total
+            if callback and pct != last_pct:
+                last_pct = pct
+                callback(min(pct, 99))
+            time.sleep(1)
+    finally:
+        if fh is not None:
+            fh.close()
 
 # db_key is the shorthand string for "gg2" or "silva" best keep it str here for future reference 
 def run_blast(query_fa: PathLike, db_key: str, out_tsv: PathLike, *, options: BlastOptions = BlastOptions(), search_id: float = 97.0, search_qcov: float = 80.0, report_id: float = 97.0, report_qcov: float = 80.0, max_target_seqs: int = 5, threads: int = 1, on_progress: Optional[Callable[[int], None]] = None, log_missing: PathLike | None = None, clean_titles: bool = False, export_sweeper: bool = False, id_normaliser: str = "strip_suffix" ) -> None:
@@ -156,9 +215,9 @@ def run_blast(query_fa: PathLike, db_key: str, out_tsv: PathLike, *, options: Bl
         raise FileNotFoundError(q) 
     # compute total queries here 
 
-    total = sum(1 for _ in SeqIO.parse(q, "fasta"))
+    total = _count_fasta_records(q)
     if total == 0:    # input is FASTQ 
-        total = sum(1 for _ in SeqIO.parse(q, "fastq")) # blast now accepts fastq on the offchance the user wants to use fastq instead of fasta.....  
+        total = _count_fastq_records(q) # blast now accepts fastq on the offchance the user wants to use fastq instead of fasta.....  
     if total == 0:
         hint = _build_empty_query_hint(q)
         raise ValueError(
@@ -232,28 +291,41 @@ def run_blast(query_fa: PathLike, db_key: str, out_tsv: PathLike, *, options: Bl
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
+            bufsize=_STDOUT_CHUNK,
             env=env,
             )
 
         done, next_log = 0, 5 # log every 5% incrementally ......
+        last_pct = -1 # callbacks only fire when the integer percentage moves
+        carry = b"" # partial trailing line held over to the next chunk
 
-        for ln in proc.stdout:
+        # binary chunks instead of line-buffered text: rows are counted with bytes.count,
+        # and progress is pushed once per chunk rather than once per row
+        while chunk := proc.stdout.read1(_STDOUT_CHUNK):
             if thr and thr.isInterruptionRequested():
                 proc.terminate()
                 proc.wait()
                 raise RuntimeError("Cancelled")
-            if ln and not ln.startswith("#"): # data row, not BLAST banner
-                done += 1                         # one query finished
-                pct = int(done / total * 100)
-
-                if on_progress:                   # GUI / tqdm callback 
-                    on_progress(min(pct, 99))    # keep 100% for the end 
-
-                if pct >= next_log: # terminal log 
-                    L.info("Progress %d %%", pct)
-                    next_log += 5
+            buf = carry + chunk
+            cut = buf.rfind(b"\n") + 1
+            carry = buf[cut:]
+            if not cut:
+                continue
+            done += _count_data_rows(buf[:cut]) # data rows, not BLAST banner
+            pct = done * 100 // total
+            if pct == last_pct:
+                continue
+            last_pct = pct
+
+            if on_progress:                   # GUI / tqdm callback 
+                on_progress(min(pct, 99))    # keep 100% for the end 
+
+            if pct >= next_log: # terminal log 
+                L.info("Progress %d %%", pct)
+                next_log = pct - pct % 5 + 5
+
+        if carry:
+            done += _count_data_rows(carry) # final row without a trailing newline
 
         rc = proc.wait()
         if thr and thr.isInterruptionRequested():
@@ -289,9 +361,15 @@ def run_blast(query_fa: PathLike, db_key: str, out_tsv: PathLike, *, options: Bl
             Path(out_tsv).write_text(header_row())  
         else:
             # hits present head is appended then data is transfered over to final results file 
-            with open(out_tsv, "w") as final_fh, tmp_out.open("r") as blast_fh:
-                final_fh.write(header_row()) 
-                shutil.copyfileobj(blast_fh, final_fh) # copies over blast results after header row is appeded first  
+            if clean_titles:
+                with open(out_tsv, "w") as final_fh, tmp_out.open("r") as blast_fh:
+                    final_fh.write(header_row()) 
+                    # stitle cleaned row by row on the way through; no DataFrame round-trip
+                    final_fh.writelines(map(_clean_stitle_row, blast_fh))
+            else:
+                with open(out_tsv, "wb") as final_fh, tmp_out.open("rb") as blast_fh:
+                    final_fh.write(header_row().encode()) 
+                    append_file_bytes(blast_fh, final_fh) # copies over blast results after header row is appeded first  
     else: 
         # other formats (such as 7) no custom header 
         shutil.move(tmp_out, out_tsv) 
@@ -300,21 +378,17 @@ def run_blast(query_fa: PathLike, db_key: str, out_tsv: PathLike, *, options: Bl
     if thr and thr.isInterruptionRequested():
         raise RuntimeError("Cancelled")
 
-    # after BLAST call finishes this here will help in cleaning 
-    if clean_titles:
-        import re 
+    # after BLAST call finishes this here will help in cleaning (outfmt 6 is already cleaned while copying above)
+    if clean_titles and not header_needed:
         # keep only Genus-Species (dropping sseqid and hitlength information from database attached to name of ID that was submitted) 
-        df = pd.read_csv(out_tsv, sep="\t", names=FIELD_LIST, dtype=str)
-        # strip any # banner / padding and create sample_id 
-        df = df.rename(columns=lambda c: c.lstrip("# ").strip())
-        # derive sample_id (example rule: drop well / driection suffix) 
+        df = pd.read_csv(out_tsv, sep="\t", names=FIELD_LIST, header=None, dtype=str)
 
         df["stitle"] = (
             df["stitle"]
             .str.split("|").str[-1] # drop gi|...|ref|.... 
             .str.lstrip(">")  # stray '>' and whitespace assuming fastq or stitle is used here.......  
             .str.strip() # this is what removes the whitespace  
-            .str.replace(r"^[A-Z]{1,4}\d{5,8}(?:\.\d+){0,2}\s+", "", regex=True) # SILVA "JN193283" prefix
+            .str.replace(_SILVA_PREFIX_RX, "", regex=True) # SILVA "JN193283" prefix
             )
         df.to_csv(out_tsv, sep="\t", index=False)  
 
@@ -329,6 +403,7 @@ def run_blast(query_fa: PathLike, db_key: str, out_tsv: PathLike, *, options: Bl
         # ---------- read full BLAST table, clean column whitespace --------
         hits_df = (pd.read_csv(all_hits, sep="\t", dtype=str)
                    .rename(columns=lambda c: c.lstrip("# ").strip())) 
+        hit_cols = list(hits_df.columns) # as written, before sample_id is added below
 
         # add sample_id once, using the SAME normaliser here as postblast consistent       
         norm = NORMALISERS[id_normaliser]
@@ -352,7 +427,7 @@ def run_blast(query_fa: PathLike, db_key: str, out_tsv: PathLike, *, options: Bl
         hits_ok["best_pident"] = pd.to_numeric(hits_ok["best_pident"], errors="coerce")
         hits_ok["best_qcov"] = pd.to_numeric(hits_ok["best_qcov"], errors="coerce") 
 
-        all_ids = {rec.id for rec in SeqIO.parse(query_fa, "fasta")}
+        all_ids = _fasta_ids(Path(query_fa))
         full = pd.DataFrame(index=sorted(all_ids))
         full["status"] = np.where(full.index.isin(hits_ok.index), "PASS", "FAIL")
         full = full.join(hits_ok)
@@ -383,12 +458,13 @@ def run_blast(query_fa: PathLike, db_key: str, out_tsv: PathLike, *, options: Bl
         ).to_csv(full_path, sep="\t", index=False)
 
         pass_ids = full.query("status == 'PASS'").index.astype(str)
-        (pd.read_csv(all_hits, sep="\t", dtype=str).rename(columns=lambda c: c.lstrip("# ").strip()).query("qseqid in @pass_ids")).to_csv(hits_path, sep="\t", index=False)
+        # reuse the table already in memory rather than parsing the hits TSV a second time
+        hits_df.loc[hits_df["qseqid"].isin(pass_ids), hit_cols].to_csv(hits_path, sep="\t", index=False)
 
         Path(log_missing).parent.mkdir(parents=True, exist_ok=True)
         missing_ids = full.query("status == 'FAIL'").index.tolist()
-        Path(log_missing).write_text("\n".join(missing_ids) +
-                                     ("\n" if missing_ids else ""))
+        with open(log_missing, "wb") as miss_fh: # streamed; no joined copy of every ID held in memory
+            miss_fh.writelines(f"{m}\n".encode() for m in missing_ids)
 
         L.info("PASS %d | FAIL %d → %s  (full=%s , hits=%s)",
                len(pass_ids), len(missing_ids),
@@ -947,6 +947,9 @@ class MainWindow(QMainWindow):
         self.cap3_qual_chk = QCheckBox("Use per-base quality scores for assembly (its required for correct CAP3 scoring)")
         self.cap3_qual_chk.setToolTip("Use QUAL files to weight CAP3 assembly scoring it ensures its correct.")
 
+        self.reuse_contigs_chk = QCheckBox("Reuse existing CAP3 contigs")
+        self.reuse_contigs_chk.setToolTip("Skip CAP3 for samples whose contigs were built from the same reads and settings.")
+
         self.write_blast_inputs_chk = QCheckBox("Create BLAST input file (contigs or singlets)")
         self.write_blast_inputs_chk.setToolTip("Emit asm/blast_inputs.fasta + asm/blast_inputs.tsv.")
 
@@ -1114,6 +1117,9 @@ class MainWindow(QMainWindow):
         self.cap3_qual_chk.setChecked(
             self.settings.value("cap3_use_qual", True, type=bool)
         )
+        self.reuse_contigs_chk.setChecked(
+            self.settings.value("reuse_contigs", False, type=bool)
+        )
         self.write_blast_inputs_chk.setChecked(
             self.settings.value("write_blast_inputs", True, type=bool)
         )
@@ -1168,6 +1174,9 @@ class MainWindow(QMainWindow):
         self.cap3_qual_chk.toggled.connect(
             lambda checked: self.settings.setValue("cap3_use_qual", checked)
         )
+        self.reuse_contigs_chk.toggled.connect(
+            lambda checked: self.settings.setValue("reuse_contigs", checked)
+        )
         self.write_blast_inputs_chk.toggled.connect(
             lambda checked: self.settings.setValue("write_blast_inputs", checked)
         )
@@ -1641,6 +1650,7 @@ class MainWindow(QMainWindow):
         cap3_opts.addWidget(self.cap3_profile_combo)
         cap3_opts.addWidget(self.cap3_extra_args_edit)
         cap3_opts.addWidget(self.cap3_qual_chk)
+        cap3_opts.addWidget(self.reuse_contigs_chk)
         cap3_opts.addWidget(self.write_blast_inputs_chk)
         cap3_opts.addWidget(self.use_blast_inputs_combo)
         cap3_opts.addWidget(self.overlap_audit_chk)
@@ -1741,6 +1751,7 @@ class MainWindow(QMainWindow):
             self.cap3_profile_combo,
             self.cap3_extra_args_edit,
             self.cap3_qual_chk,
+            self.reuse_contigs_chk,
             self.write_blast_inputs_chk,
             self.use_blast_inputs_combo,
             self.overlap_audit_chk,
@@ -1779,6 +1790,7 @@ class MainWindow(QMainWindow):
             "cap3_profile": self.cap3_profile_combo.currentData(),
             "cap3_extra_args": extra_args,
             "cap3_use_qual": self.cap3_qual_chk.isChecked(),
+            "reuse_contigs": self.reuse_contigs_chk.isChecked(),
             "write_blast_inputs": write_blast_inputs,
             "use_blast_inputs": use_blast_inputs,
         }
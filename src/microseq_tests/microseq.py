@@ -177,6 +177,8 @@ def main() -> None:
     p_asm.add_argument("--cap3-extra-args", nargs="*", help="Additional CAP3 args appended after the selected profile")
     p_asm.add_argument("--cap3-qual", action="store_true", default=True, help="Use per-base quality scores during CAP3 assembly (required for correct scoring)")
     p_asm.add_argument("--no-cap3-qual", dest="cap3_qual", action="store_false", help="Disable QUAL usage for CAP3 assembly; degrades CAP3 scoring")
+    p_asm.add_argument("--threads", "--assembly-threads", dest="threads", type=int, default=1, help="Samples to assemble concurrently in paired mode (one CAP3 process each)")
+    p_asm.add_argument("--reuse-contigs", action="store_true", help="Skip CAP3 for samples whose *.cap.contigs was stamped with the same inputs and settings")
 
     # blast 
     db_choices = list(cfg["databases"].keys())    # e.g. here ['gg2', 'silva', 'ncbi16s']
@@ -460,6 +462,8 @@ def main() -> None:
                 enforce_same_well=args.enforce_well,
                 well_pattern=args.well_pattern,
                 use_qual=args.cap3_qual,
+                threads=args.threads,
+                reuse=args.reuse_contigs,
             )
             if args.overlap_audit:
                 pairing_dir = pathlib.Path(args.input)
@@ -475,7 +479,7 @@ def main() -> None:
                 audit_path = output_dir / "qc" / "overlap_audit.tsv"
                 _write_overlap_audit(paired_samples, audit_path)
         else:
-            run_assembly(args.input, args.output, threads=args.threads) 
+            run_assembly(args.input, args.output, threads=args.threads, reuse=args.reuse_contigs) 
 
     elif args.cmd == "blast":
         total = sum(1 for _ in SeqIO.parse(args.input, "fasta"))
@@ -583,8 +583,8 @@ def run_assembly(fasta_in: PathLike, out_dir: PathLike, *, threads: int | None =
     de_novo_assembly(Path(fasta_in), Path(out_dir), **options)
     return 0
 
-def run_paired_assembly(input_dir: PathLike, output_dir: PathLike, *, dup_policy: DupPolicy = DupPolicy.ERROR, cap3_options=None, fwd_pattern: str | None = None, rev_pattern: str | None = None, pairing_report: PathLike | None = None, enforce_same_well: bool = False, well_pattern: str | re.Pattern[str] | None = None, use_qual: bool = True, on_stage=None, on_progress=None) -> list[Path]:
-    return assemble_pairs(Path(input_dir), Path(output_dir), dup_policy=dup_policy, cap3_options=cap3_options, fwd_pattern=fwd_pattern, rev_pattern=rev_pattern, pairing_report=pairing_report, enforce_same_well=enforce_same_well, well_pattern=well_pattern, use_qual=use_qual, on_stage=on_stage, on_progress=on_progress )
+def run_paired_assembly(input_dir: PathLike, output_dir: PathLike, *, dup_policy: DupPolicy = DupPolicy.ERROR, cap3_options=None, fwd_pattern: str | None = None, rev_pattern: str | None = None, pairing_report: PathLike | None = None, enforce_same_well: bool = False, well_pattern: str | re.Pattern[str] | None = None, use_qual: bool = True, threads: int | None = None, reuse: bool = False, on_stage=None, on_progress=None) -> list[Path]:
+    return assemble_pairs(Path(input_dir), Path(output_dir), dup_policy=dup_policy, cap3_options=cap3_options, fwd_pattern=fwd_pattern, rev_pattern=rev_pattern, pairing_report=pairing_report, enforce_same_well=enforce_same_well, well_pattern=well_pattern, use_qual=use_qual, threads=threads, reuse=reuse, on_stage=on_stage, on_progress=on_progress )
 
 def stage_paired_fastas_from_fastq_dir(input_fastq_dir: PathLike, output_fasta_dir: PathLike, *, use_qual: bool = True,) -> list[Path]:
     """
@@ -3041,6 +3041,8 @@ def run_full_pipeline(
     cap3_profile: str = "strict",
     cap3_extra_args: Sequence[str] | None = None,
     cap3_use_qual: bool = True,
+    assembly_jobs: int = 1,
+    reuse_contigs: bool = False,
     assembler_id: str | None = None,
     assembler_mode: str | None = None,
     write_blast_inputs: bool = True,
@@ -3074,6 +3076,10 @@ def run_full_pipeline(
     to emit ``qc/overlap_audit.tsv`` and annotate paired assembly summaries with
     overlap status codes. CAP3 profiles and extra args can be supplied via
     *cap3_profile* and *cap3_extra_args* to tune paired assembly parameters.
+    *threads* feeds blastn, vsearch (orient/collapse/chimera) and the assembler
+    comparison, but no longer sets paired CAP3 concurrency: *assembly_jobs* sets how many
+    paired CAP3 samples run at once (default 1). Set *reuse_contigs* to keep CAP3 contigs stamped with
+    the same reads and settings.
     """
 
     on_stage = on_stage or (lambda *_: None)
@@ -3274,6 +3280,8 @@ def run_full_pipeline(
                 enforce_same_well=enforce_same_well,
                 well_pattern=well_pattern,
                 use_qual=cap3_use_qual,
+                threads=assembly_jobs,
+                reuse=reuse_contigs,
                 on_stage=on_stage,
                 on_progress=assembly_progress,
             )
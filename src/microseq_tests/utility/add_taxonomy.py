@@ -63,6 +63,9 @@ def run_taxonomy_join(hits_fp: Path, taxonomy_fp: Path, out_fp: Path, fill_speci
                 }
             )
     )
+    # only the accessions this table actually hit can match - SILVA/GG2 maps carry
+    # hundreds of thousands of rows, so shrink the right side before hashing the join
+    tax = tax[tax["sseqid"].isin(hits["sseqid"].unique())]
     # ------------------------------------------------------------------ #
     # sanity-check
     
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import argparse, os, sys, urllib.request, tarfile, zipfile, gzip, \
        shutil, subprocess, yaml
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
@@ -91,19 +92,36 @@ def ask_pipeline_usage() -> bool:
 pipeline_user = ask_pipeline_usage()       
 
 # ───────────────────────── helpers ──────────────────────────────────────
+COPY_BUF = 1 << 20   # 1 MiB chunks keep multi-GB archive copies off the small-read path
+
 def log(msg: str) -> None:
     print(f"[setup] {msg}")
 
+ARIA2C = shutil.which("aria2c")   # optional: segmented downloads when installed
+
+def run(cmd: list) -> None: # accept Path or str 
+    log("+" + " ".join(map(str, cmd))) # stringify for loggin 
+    subprocess.run(list(map(str,cmd)), check=True)
+
 def dl(url: str, dest: Path) -> None:
     if dest.exists():
         log(f"✓ {dest.name} already present")
         return
     log(f"→ downloading {url}")
-    urllib.request.urlretrieve(url, dest)
-
-def run(cmd: list) -> None: # accept Path or str 
-    log("+" + " ".join(map(str, cmd))) # stringify for loggin 
-    subprocess.run(list(map(str,cmd)), check=True)
+    # download under a .part name so an interrupted fetch never looks "already present"
+    part = dest.with_name(f"{dest.name}.part")
+    if ARIA2C:
+        try:
+            # several connections per server saturate high-latency links a single stream can't
+            run([ARIA2C, "-x", "8", "-s", "8", "-c", "--file-allocation=none",
+                 "--console-log-level=warn", "-d", dest.parent, "-o", part.name, url])
+            part.replace(dest)
+            return
+        except (OSError, subprocess.CalledProcessError) as e:
+            log(f"aria2c failed ({e}); falling back to urllib")
+            part.unlink(missing_ok=True)
+    urllib.request.urlretrieve(url, part)
+    part.replace(dest)
 
 def makeblastdb(fasta: Path, out_prefix: Path) -> None:
     if (out_prefix.with_suffix(".nsq")).exists():
@@ -113,8 +131,21 @@ def makeblastdb(fasta: Path, out_prefix: Path) -> None:
 def extract_member(zip_path: Path, pattern: str, out_path: Path) -> None:
     with zipfile.ZipFile(zip_path) as zf:
         member = next(n for n in zf.namelist() if n.endswith(pattern))
-        with zf.open(member) as fin, open(out_path, "wb") as fout:
-            shutil.copyfileobj(fin, fout)
+        with zf.open(member) as fin, open(out_path, "wb", buffering=COPY_BUF) as fout:
+            shutil.copyfileobj(fin, fout, length=COPY_BUF)
+
+def gunzip_to(gz: Path, out_path: Path) -> None:
+    """Decompress ``gz`` into ``out_path`` (pigz if installed, else in-process gzip)."""
+    part = out_path.with_name(f"{out_path.name}.part")
+    pigz = shutil.which("pigz")
+    if pigz:
+        log(f"+{pigz} -dc {gz} > {out_path}")
+        with open(part, "wb") as fout:
+            subprocess.run([pigz, "-dc", str(gz)], check=True, stdout=fout)
+    else:
+        with gzip.open(gz, "rb") as fin, open(part, "wb", buffering=COPY_BUF) as fout:
+            shutil.copyfileobj(fin, fout, length=COPY_BUF)
+    part.replace(out_path)
 
 
 # ------ Adding TaxonKit helper -------------------------------------
@@ -172,8 +203,7 @@ def fetch_silva() -> None:
     fasta = sd / gz.stem
     if not fasta.exists():
         log("→ extracting SILVA")
-        with gzip.open(gz, "rb") as fin, open(fasta, "wb") as fout:
-            shutil.copyfileobj(fin, fout)
+        gunzip_to(gz, fasta)
 
     silva_tax = sd / "taxonomy.tsv"
     if not silva_tax.exists():
@@ -254,8 +284,12 @@ def fetch_ncbi() -> None:
 
 # ────────────────────────── main driver ─────────────────────────────────
 def main() -> None:
-    for fn in (fetch_gg2, fetch_silva, fetch_ncbi):
-        fn()
+    # each fetch talks to a different server and builds its own BLAST index,
+    # so run them side by side instead of summing three download times
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        futures = [ex.submit(fn) for fn in (fetch_gg2, fetch_silva, fetch_ncbi)]
+        for fut in as_completed(futures):
+            fut.result() # re-raise the first failure here
     log(f" ✓ All databases downloaded to {db_root}")
 
     # ---------- env-hook snippet -----------------------------------------
@@ -1,5 +1,8 @@
 from __future__ import annotations 
+import errno
+import json
 import logging
+import os
 
 from pathlib import Path
 import re
@@ -12,11 +15,81 @@ L = logging.getLogger(__name__)
 from pathlib import Path 
 import re, shutil, logging 
 
-__all__ = ["normalise_tsv", "write_fasta_and_qual_from_fastq"] 
+__all__ = ["normalise_tsv", "write_fasta_and_qual_from_fastq", "is_up_to_date", "run_stamp", "write_stamp", "clear_stamp", "append_file_bytes"] 
 
 _TAB_RX = re.compile(r"( {2,}|,)") # 2 + spaces or comma 
 _NEEDS_RX = re.compile(r"\t") # have at least one TAB char 
 
+_COPY_BUF = 1 << 20 # 1 MiB chunks for the userland copy path 
+# errnos meaning "sendfile can't do this file pair", as opposed to a real I/O failure 
+_SENDFILE_UNSUPPORTED = frozenset({errno.EINVAL, errno.ENOSYS, errno.ENOTSUP, errno.EXDEV, errno.ENOTSOCK})
+
+def append_file_bytes(src_fh, dst_fh) -> None:
+    """
+    Append the whole of binary ``src_fh`` to binary ``dst_fh``.
+
+    Uses ``os.sendfile`` so the copy stays in the kernel where available. If sendfile is
+    missing, or refuses the file pair with one of the "unsupported" errnos (even part-way
+    through), the copy resumes in userland from the first byte not yet sent, so nothing
+    is duplicated or lost. Any other ``OSError`` (e.g. ENOSPC) propagates.
+    """
+    in_fd = src_fh.fileno()
+    size = os.fstat(in_fd).st_size
+    if size == 0:
+        return
+    dst_fh.flush() # buffered bytes must land before the kernel writes at the fd offset 
+    offset = 0
+    if hasattr(os, "sendfile"):
+        try:
+            while offset < size:
+                sent = os.sendfile(dst_fh.fileno(), in_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError as exc:
+            if exc.errno not in _SENDFILE_UNSUPPORTED:
+                raise
+    if offset < size:
+        src_fh.seek(offset)
+        shutil.copyfileobj(src_fh, dst_fh, _COPY_BUF)
+
+def _stamp_path(output: str | Path) -> Path:
+    return Path(f"{output}.stamp.json")
+
+def run_stamp(inputs, **settings) -> dict:
+    """
+    Fingerprint one tool run: every input as (resolved path, size, mtime_ns), sorted,
+    plus whatever ``settings`` shape the output (argv, flags, config values). 
+    """
+    files = []
+    for src in sorted(str(Path(p).resolve()) for p in inputs):
+        st = os.stat(src)
+        files.append([src, st.st_size, st.st_mtime_ns])
+    # JSON round-trip so tuples/lists compare equal to what is read back from disk
+    return json.loads(json.dumps({"inputs": files, "settings": settings}))
+
+def write_stamp(output: str | Path, stamp: dict) -> None:
+    """Record ``stamp`` next to ``output``, together with the output's own size and mtime."""
+    st = Path(output).stat()
+    payload = {"stamp": stamp, "output": [st.st_size, st.st_mtime_ns]}
+    _stamp_path(output).write_text(json.dumps(payload, indent=1), encoding="utf-8")
+
+def clear_stamp(output: str | Path) -> None:
+    """Drop the stamp for ``output`` (call before regenerating it so a failed run is never reused)."""
+    _stamp_path(output).unlink(missing_ok=True)
+
+def is_up_to_date(output: str | Path, stamp: dict) -> bool:
+    """
+    True when ``output`` still exists unchanged and was produced by a run whose
+    :func:`run_stamp` equals ``stamp`` (same inputs, same sizes/mtimes, same settings).
+    """
+    try:
+        st = Path(output).stat()
+        payload = json.loads(_stamp_path(output).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return False
+    return payload.get("output") == [st.st_size, st.st_mtime_ns] and payload.get("stamp") == stamp
+
 def normalise_tsv(path: str | Path) -> Path:
     """
     Ensure path is a true tab-separated file. 
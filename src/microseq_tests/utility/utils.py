@@ -1,6 +1,7 @@
 # ── src/microseq_tests/utility/utils.py ────────────────────────────────
 from __future__ import annotations
 
+import copy
 import errno
 import logging
 import logging.handlers
@@ -24,11 +25,23 @@ ROOT      = _find_repo_root()
 LOG_ROOT  = ROOT / "logs"
 CONF_PATH = ROOT / "config" / "config.yaml"
 _SESSION_WARNED = False
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
 
 # ── tiny helpers  ──────────────────────────────────────────────────────
 def load_config(path: str | Path = CONF_PATH):
-    with Path(path).open() as fh:
-        return yaml.safe_load(fh)
+    """
+    Parse config.yaml once per process and re-read it only when the file changes.
+    Each caller gets its own deep copy so mutating the result never leaks back.
+    """
+    p = Path(path).absolute()
+    st = p.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(p)
+    if cached is None or cached[0] != stamp:
+        with p.open() as fh:
+            cached = (stamp, yaml.safe_load(fh))
+        _CONFIG_CACHE[p] = cached
+    return copy.deepcopy(cached[1])
 
 def expand_db_path(template: str) -> str:
     """
@@ -31,3 +31,19 @@ def test_run_blast_empty_query_raises_with_selected_mode_hint(tmp_path: Path, mo
     assert "selected_backend_no_payload=1" in message
     assert "ambiguous_overlap=1" in message
 
+
+
+def test_count_fasta_records_byte_scan(tmp_path: Path):
+    from microseq_tests.blast.run_blast import _count_fasta_records
+
+    empty = tmp_path / "empty.fasta"
+    empty.write_bytes(b"")
+    assert _count_fasta_records(empty) == 0
+
+    fa = tmp_path / "q.fasta"
+    fa.write_bytes(b">a desc\nACGT\nAC\r\n>b\nGG\n>c\n")
+    assert _count_fasta_records(fa) == 3
+
+    fq = tmp_path / "q.fastq"
+    fq.write_bytes(b"@r1\nACGT\n+\n>>>>\n")
+    assert _count_fasta_records(fq) == 0
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+import os
 import logging
 import sys
 import types
@@ -1520,3 +1521,65 @@ def test_merge_two_reads_report_includes_high_conflict_column(tmp_path: Path) ->
     value_cols = lines[1].split("\t")
     assert header_cols[-1] == "high_conflict_mismatches"
     assert len(header_cols) == len(value_cols)
+
+
+def test_write_combined_fasta_adds_newline_between_sources(tmp_path: Path) -> None:
+    """Sources without a trailing newline must not run into the next header."""
+    fasta_a = tmp_path / "a.fasta"
+    fasta_b = tmp_path / "b.fasta"
+    empty = tmp_path / "empty.fasta"
+    dest = tmp_path / "combined.fasta"
+
+    fasta_a.write_bytes(b">a1 first read\nACGT")
+    empty.write_bytes(b"")
+    fasta_b.write_bytes(b">b1\nTTTT\n")
+
+    _write_combined_fasta([fasta_a, empty, fasta_b], dest, use_qual=False)
+
+    assert dest.read_bytes() == b">a1 first read\nACGT\n>b1\nTTTT\n"
+    assert not dest.with_name(f"{dest.name}.qual").exists()
+
+
+def test_write_combined_fasta_keeps_fasta_and_qual_in_step(tmp_path: Path) -> None:
+    """Wrapped and padded FASTA inputs are normalised the same way the QUAL side is validated."""
+    fasta_a = tmp_path / "a.fasta"
+    dest = tmp_path / "combined.fasta"
+    fasta_a.write_text("\n>a1 desc\nACGT\nAC\n\n>a2\nGG\n", encoding="utf-8")
+    rec1 = SeqRecord(Seq("ACGTAC"), id="a1", description="")
+    rec1.letter_annotations["phred_quality"] = [30] * 6
+    rec2 = SeqRecord(Seq("GG"), id="a2", description="")
+    rec2.letter_annotations["phred_quality"] = [20, 20]
+    _write_qual(Path(f"{fasta_a}.qual"), [rec1, rec2])
+
+    _write_combined_fasta([fasta_a], dest, use_qual=True)
+
+    assert dest.read_text(encoding="utf-8") == ">a1 desc\nACGTAC\n>a2\nGG\n"
+    combined_qual = list(SeqIO.parse(dest.with_name(f"{dest.name}.qual"), "qual"))
+    assert [rec.id for rec in combined_qual] == ["a1", "a2"]
+
+
+def test_de_novo_assembly_links_input_instead_of_copying(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The staged CAP3 input should share the source inode and be refreshed on re-runs."""
+    dna = importlib.import_module("microseq_tests.assembly.de_novo_assembly")
+
+    src = tmp_path / "reads.fasta"
+    src.write_text(">r1\nACGT\n", encoding="utf-8")
+    out_dir = tmp_path / "asm"
+    out_dir.mkdir()
+    (out_dir / "reads.fasta").write_text(">stale\nA\n", encoding="utf-8")
+
+    monkeypatch.setattr(dna, "load_config", lambda: {"tools": {"cap3": "cap3"}})
+
+    def fake_run(cmd, check, cwd=None, **kwargs):
+        Path(cwd, f"{cmd[1]}.cap.contigs").write_text(">contig\nACGT\n", encoding="utf-8")
+        return types.SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(dna.subprocess, "run", fake_run)
+
+    for _ in range(2):
+        contig = dna.de_novo_assembly(src, out_dir)
+
+    staged = out_dir / "reads.fasta"
+    assert contig == out_dir / "reads.fasta.cap.contigs"
+    assert os.path.samefile(staged, src)
+    assert staged.read_text(encoding="utf-8") == ">r1\nACGT\n"
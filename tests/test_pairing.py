@@ -3,6 +3,7 @@ from __future__ import annotations  # will help me with using typehints in my co
 import os 
 import stat 
 import subprocess
+import time
 import types
 from pathlib import Path 
 
@@ -24,7 +25,9 @@ pytest.importorskip("Bio")
 # --------------------------
 
 from microseq_tests.assembly import paired_assembly 
+from microseq_tests.assembly import pairing as pairing_mod
 from microseq_tests.assembly.pairing import (
+        DETECTORS,
         DupPolicy,
         extract_sid_orientation,
         group_pairs,
@@ -41,6 +44,8 @@ def test_extract_sid_orientation_basic():
     # Assert specific input patterns map to expected Sample IDs (SID) and orient:
     assert extract_sid_orientation("A3_27F_x.fasta") == ("A3", "F")
     assert extract_sid_orientation("A3-1492R.fa") == ("A3", "R") 
+    # an earlier copy of the token text inside the sample ID must not cut the ID short
+    assert extract_sid_orientation("Plate27F-3_27F_x.fasta") == ("Plate27F-3", "F")
 
 def test_extract_sid_orientation_honors_custom_detectors():
     """Custom detectors passed in should take precedence over the defaults."""
@@ -54,6 +59,99 @@ def test_extract_sid_orientation_honors_custom_detectors():
         "sample_custom-token_read.fasta", detectors=[custom]
     ) == ("sid-custom", "F")
 
+def test_extract_sid_orientation_fused_matches_detector_registry():
+    """The fused default regex must agree with running DETECTORS one by one, including priority."""
+
+    names = [
+        "A3_27F_x.fasta",
+        "A3-1492R.fa",
+        "27F_S1.fasta",
+        "27F_S1_1492R_x.fasta",
+        "S1_27F_1492R.fasta",
+        "plate1-A01_8f-run2.fasta",
+        "27F-S1_1492R.fa.fasta",
+        "S1.fasta",
+        "S1_F.fasta",
+        "R_S2.seq",
+        "S_27F27F_x_27F.fasta",
+    ]
+
+    def legacy(name: str) -> tuple[str, str | None]:
+        for det in DETECTORS:
+            sid, orient = det(name)
+            if orient in ("F", "R"):
+                return sid, orient
+        return Path(name).stem, None
+
+    for name in names:
+        assert extract_sid_orientation(name) == legacy(name), name
+
+def _fwd_marker_detector(name: str) -> tuple[str, str | None]:
+    """Registry add-on used below: recognises an 'XFWD' marker the built-ins do not."""
+    stem = Path(name).stem
+    if stem.endswith("XFWD"):
+        return stem[: -len("XFWD")], "F"
+    return stem, None
+
+def test_extract_sid_orientation_runs_detectors_appended_to_registry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """A detector appended to DETECTORS must be consulted, not bypassed by the fused fast path."""
+
+    monkeypatch.setattr(pairing_mod, "DETECTORS", [*pairing_mod.DETECTORS, _fwd_marker_detector])
+
+    assert extract_sid_orientation("S1XFWD.fasta") == ("S1", "F")
+    assert extract_sid_orientation("S1_27F.fasta") == ("S1", "F") # built-ins still ahead of it
+
+    (tmp_path / "S1XFWD.fasta").write_text(">f\nA\n", encoding="utf-8")
+    (tmp_path / "S1_1492R.fasta").write_text(">r\nA\n", encoding="utf-8")
+    pairs = group_pairs(tmp_path)
+    assert pairs["S1"]["F"].name == "S1XFWD.fasta"
+
+def test_extract_sid_orientation_honors_replaced_registry(monkeypatch: pytest.MonkeyPatch):
+    """Replacing DETECTORS must drop the built-in patterns, fused or not."""
+
+    monkeypatch.setattr(pairing_mod, "DETECTORS", [_fwd_marker_detector])
+
+    assert extract_sid_orientation("S1XFWD.fasta") == ("S1", "F")
+    assert extract_sid_orientation("S1_27F.fasta") == ("S1_27F", None)
+
+def test_scan_fasta_files_matches_iter_seq_files(tmp_path: Path):
+    """The scandir walk used by group_pairs should list the same FASTA files, in the same order."""
+
+    from microseq_tests.assembly.pairing import _scan_fasta_files, iter_seq_files
+
+    for rel in ("S1_27F.fasta", "a-b/S2_27F.fasta", "a/S2_1492R.fasta", "a/b/c/S3_8F.fasta", "a/S4.fastq", "S5.ab1", ".hidden/S6_27F.fasta"):
+        target = tmp_path / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(">x\nA\n", encoding="utf-8")
+
+    expected = [p for p in iter_seq_files(tmp_path) if p.suffix.lower() in {".fasta", ".fa", ".fna"}]
+    assert _scan_fasta_files(tmp_path) == expected
+
+def test_group_pairs_splits_single_fasta_file(tmp_path: Path):
+    """A multi-record FASTA input is split into per-record files and paired by record ID."""
+
+    combined = tmp_path / "reads.fasta"
+    combined.write_text(
+        ">S1_27F_a first read\nACGT\nACGT\n>S1_1492R_a\nTTTT\n>S2_27F_a\nGGGG\n",
+        encoding="utf-8",
+    )
+
+    pairs = group_pairs(combined)
+
+    assert list(pairs) == ["S1"]
+    assert pairs["S1"]["F"].read_text(encoding="utf-8") == ">S1_27F_a first read\nACGTACGT\n"
+    assert pairs["S1"]["R"].read_text(encoding="utf-8") == ">S1_1492R_a\nTTTT\n"
+    # the unpaired S2 record never gets a temp file
+    assert sorted(p.name for p in pairs["S1"]["F"].parent.iterdir()) == ["S1_1492R_a_1.fasta", "S1_27F_a_1.fasta"]
+
+def test_stem_matches_pathlib():
+    """The string-only stem helper must agree with Path.stem, including dot and separator edge cases."""
+
+    from microseq_tests.assembly.pairing import _stem
+
+    for name in ["S1_27F.fasta", "S1.tar.gz", ".hidden", "..", ".", "", "a.", "a..b", "noext", "dir/S1.fa", "S1/1"]:
+        assert _stem(name) == Path(name).stem, name
+
 def test_group_pairs_error_on_dups(tmp_path: Path):
     """
     Verifies that duplicate forward reads raise an error under the strict 
@@ -205,6 +303,159 @@ def test_assemble_pairs_keep_separate(tmp_path: Path, monkeypatch: pytest.Monkey
     assert {cwd for _, cwd in calls} == set(expected_dirs)
 
 
+
+def test_assemble_pairs_threads_preserves_sample_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Concurrent CAP3 runs must still return contigs and metadata in sorted sample order."""
+
+    in_dir = tmp_path / "input"
+    out_dir = tmp_path / "output"
+    in_dir.mkdir()
+
+    sample_ids = ["S1", "S2", "S3", "S4"]
+    for sid in sample_ids:
+        (in_dir / f"{sid}_27F.fasta").write_text(f">{sid}f\nA\n", encoding="utf-8")
+        (in_dir / f"{sid}_1492R.fasta").write_text(f">{sid}r\nA\n", encoding="utf-8")
+
+    monkeypatch.setattr(
+        paired_assembly,
+        "load_config",
+        lambda: {"tools": {"cap3": "/bin/true"}},
+    )
+
+    def fake_run(cmd, check, cwd=None, **kwargs):
+        if len(cmd) >= 3 and cmd[1] == "list" and cmd[2] == "cap3":
+            class Result:
+                returncode = 0
+                stdout = "CAP3 test"
+                stderr = ""
+
+            return Result()
+
+        # earlier samples finish last so completion order differs from sample order
+        time.sleep(0.05 * (len(sample_ids) - sample_ids.index(Path(cwd).name)))
+        Path(cwd, f"{cmd[1]}.cap.contigs").write_text(">contig\nA\n", encoding="utf-8")
+
+        class Result:
+            returncode = 0
+            stdout = ""
+            stderr = ""
+
+        return Result()
+
+    monkeypatch.setattr(paired_assembly.subprocess, "run", fake_run)
+
+    paths = paired_assembly.assemble_pairs(in_dir, out_dir, threads=4)
+
+    assert paths == [out_dir / sid / f"{sid}_paired.fasta.cap.contigs" for sid in sample_ids]
+    metadata = (out_dir / "cap3_run_metadata.txt").read_text(encoding="utf-8")
+    cap3_rows = [line.split("\t")[0] for line in metadata.splitlines() if "_paired.fasta" in line]
+    assert cap3_rows == sample_ids
+
+
+def test_assemble_pairs_reuses_contigs_only_when_stamp_matches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """reuse=True skips CAP3 only for contigs stamped with the same inputs and settings; the default always reruns."""
+
+    in_dir = tmp_path / "input"
+    out_dir = tmp_path / "output"
+    in_dir.mkdir()
+    fwd = in_dir / "S1_27F.fasta"
+    fwd.write_text(">a\nA\n", encoding="utf-8")
+    (in_dir / "S1_1492R.fasta").write_text(">b\nA\n", encoding="utf-8")
+
+    monkeypatch.setattr(
+        paired_assembly,
+        "load_config",
+        lambda: {"tools": {"cap3": "/bin/true"}},
+    )
+
+    calls: list[Path] = []
+
+    def fake_run(cmd, check, cwd=None, **kwargs):
+        if len(cmd) >= 3 and cmd[1] == "list" and cmd[2] == "cap3":
+            return types.SimpleNamespace(returncode=0, stdout="CAP3 test", stderr="")
+        calls.append(Path(cwd))
+        Path(cwd, f"{cmd[1]}.cap.contigs").write_text(">contig\nA\n", encoding="utf-8")
+        return types.SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(paired_assembly.subprocess, "run", fake_run)
+
+    first = paired_assembly.assemble_pairs(in_dir, out_dir)
+    paired_assembly.assemble_pairs(in_dir, out_dir)
+    assert len(calls) == 2 # reuse is opt-in
+
+    second = paired_assembly.assemble_pairs(in_dir, out_dir, reuse=True)
+    assert first == second
+    assert len(calls) == 2
+    assert "reused_existing_contigs" in (out_dir / "cap3_run_metadata.txt").read_text(encoding="utf-8")
+
+    # different CAP3 options or QUAL usage must not reuse the old contig
+    paired_assembly.assemble_pairs(in_dir, out_dir, reuse=True, cap3_options=["-o", "30"])
+    assert len(calls) == 3
+    paired_assembly.assemble_pairs(in_dir, out_dir, reuse=True, cap3_options=["-o", "30"], use_qual=False)
+    assert len(calls) == 4
+
+    # an edited input is caught even when its mtime is older than the contig
+    contig_mtime = first[0].stat().st_mtime_ns
+    fwd.write_text(">a\nACGT\n", encoding="utf-8")
+    os.utime(fwd, ns=(contig_mtime - 10**9, contig_mtime - 10**9))
+    paired_assembly.assemble_pairs(in_dir, out_dir, reuse=True, cap3_options=["-o", "30"], use_qual=False)
+    assert len(calls) == 5
+
+    # adding, editing or removing only a sibling .qual file must not reuse the old contig
+    qual = in_dir / "S1_27F.fasta.qual"
+    qual.write_text(">a\n30 30 30 30\n", encoding="utf-8")
+    paired_assembly.assemble_pairs(in_dir, out_dir, reuse=True)
+    assert len(calls) == 6
+    paired_assembly.assemble_pairs(in_dir, out_dir, reuse=True)
+    assert len(calls) == 6
+    qual.write_text(">a\n10 10 10 9\n", encoding="utf-8")
+    paired_assembly.assemble_pairs(in_dir, out_dir, reuse=True)
+    assert len(calls) == 7
+    qual.unlink()
+    paired_assembly.assemble_pairs(in_dir, out_dir, reuse=True)
+    assert len(calls) == 8
+
+
+def test_assemble_pairs_streams_cap3_output_to_logs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """CAP3 output goes straight to the per-sample logs; a failure surfaces only the stderr tail."""
+
+    in_dir = tmp_path / "input"
+    out_dir = tmp_path / "output"
+    in_dir.mkdir()
+    (in_dir / "S1_27F.fasta").write_text(">a\nA\n", encoding="utf-8")
+    (in_dir / "S1_1492R.fasta").write_text(">b\nA\n", encoding="utf-8")
+
+    monkeypatch.setattr(
+        paired_assembly,
+        "load_config",
+        lambda: {"tools": {"cap3": "/bin/true"}},
+    )
+
+    noisy = "x" * 20000 + "\nfinal error line\n"
+
+    def fake_run(cmd, check, cwd=None, **kwargs):
+        if len(cmd) >= 3 and cmd[1] == "list" and cmd[2] == "cap3":
+            return types.SimpleNamespace(returncode=0, stdout="CAP3 test", stderr="")
+        kwargs["stdout"].write("alignment report\n")
+        kwargs["stderr"].write(noisy)
+        kwargs["stderr"].flush()
+        raise subprocess.CalledProcessError(1, cmd)
+
+    monkeypatch.setattr(paired_assembly.subprocess, "run", fake_run)
+
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        paired_assembly.assemble_pairs(in_dir, out_dir)
+
+    assert excinfo.value.stderr.endswith("final error line\n")
+    assert len(excinfo.value.stderr) <= 8192
+
+    logs_dir = out_dir / "logs" / "cap3"
+    stderr_log = (logs_dir / "S1__cap3_default.stderr.log").read_text(encoding="utf-8")
+    stdout_log = (logs_dir / "S1__cap3_default.stdout.log").read_text(encoding="utf-8")
+    assert stderr_log.startswith("# timestamp_utc:")
+    assert stderr_log.endswith(noisy)
+    assert stdout_log.endswith("alignment report\n")
+
 def test_assemble_pairs_non_singleton_merge_fallback_logs_counts(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     in_dir = tmp_path / "input"
     out_dir = tmp_path / "output"
@@ -55,6 +55,40 @@ def test_paired_error_includes_suggestions(tmp_path: Path, monkeypatch: pytest.M
     assert "Example flag" in message
 
 
+def test_paired_pipeline_keeps_blast_threads_out_of_assembly(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """BLAST threads must not set CAP3 concurrency; that comes from assembly_jobs (default 1)."""
+
+    infile = tmp_path / "input"
+    infile.mkdir()
+    (tmp_path / "out" / "passed_qc_fastq").mkdir(parents=True)
+
+    def fake_stage(_fastq_dir, fasta_dir, *, use_qual=True):
+        fasta_dir = Path(fasta_dir)
+        fasta_dir.mkdir(parents=True, exist_ok=True)
+        fwd = fasta_dir / "S1_27F.fasta"
+        rev = fasta_dir / "S1_1492R.fasta"
+        fwd.write_text(">fwd\nA\n", encoding="utf-8")
+        rev.write_text(">rev\nA\n", encoding="utf-8")
+        return [fwd, rev]
+
+    seen: list[int | None] = []
+
+    def fake_assemble_pairs(*_args, **kwargs):
+        seen.append(kwargs.get("threads"))
+        raise RuntimeError("stop-after-assembly")
+
+    monkeypatch.setattr(pipeline, "run_trim", lambda *_a, **_k: 0)
+    monkeypatch.setattr(pipeline, "run_fastq_to_fasta", lambda *_a, **_k: None)
+    monkeypatch.setattr(pipeline, "stage_paired_fastas_from_fastq_dir", fake_stage)
+    monkeypatch.setattr(pipeline, "assemble_pairs", fake_assemble_pairs)
+
+    for kwargs in ({"threads": 8}, {"threads": 8, "assembly_jobs": 3}):
+        with pytest.raises(RuntimeError, match="stop-after-assembly"):
+            pipeline.run_full_pipeline(infile, "nt", tmp_path / "out", mode="paired", **kwargs)
+
+    assert seen == [1, 3]
+
+
 def test_suggest_pairing_patterns_reads_fastq_and_ab1(tmp_path: Path):
     (tmp_path / "S1_27F.fastq").write_text("@r1\nA\n+\n!\n", encoding="utf-8")
     (tmp_path / "S1_1492R.ab1").write_text("", encoding="utf-8")
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import errno
+import io
+import os
+from pathlib import Path
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("Bio")
+
+import microseq_tests.blast.run_blast as rb
+from microseq_tests.utility import io_utils
+
+HITS = [
+    "q1\tgi|123|ref|NR_1.1|\t99.5\t1500\t100\t1500\t0.0\t2700\tNR_1.1 Escherichia coli\n",
+    "q2\tJN193283.1.1400\t91.0\t1400\t85\t1190\t1e-50\t1500\t>JN193283.1.1400 Bacillus subtilis\n",
+]
+
+
+class _FakeBlast:
+    """Stand-in for the blastn Popen: writes canned rows to the -out path."""
+
+    def __init__(self, cmd, **_kw):
+        out = Path(cmd[cmd.index("-out") + 1])
+        out.write_text("".join(HITS))
+        self.stdout = io.BytesIO(b"")
+        self.returncode = 0
+
+    def wait(self):
+        return 0
+
+    def terminate(self):
+        pass
+
+
+@pytest.fixture()
+def fake_blast(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(rb, "load_config", lambda: {"databases": {"nt": {"blastdb": "dummy"}}})
+    monkeypatch.setattr(rb, "UNBUFFER_PREFIX", [])
+    monkeypatch.setattr(rb.subprocess, "Popen", _FakeBlast)
+    query = tmp_path / "q.fasta"
+    query.write_text(">q1\nACGT\n>q2\nACGT\n>q3\nACGT\n")
+    return query
+
+
+def test_clean_titles_keeps_single_header(fake_blast: Path, tmp_path: Path):
+    out = tmp_path / "hits.tsv"
+    rb.run_blast(fake_blast, "nt", out, clean_titles=True)
+
+    lines = out.read_text().splitlines()
+    assert lines[0] == "\t".join(rb.FIELD_LIST)
+    assert len(lines) == 1 + len(HITS)
+    df = pd.read_csv(out, sep="\t", dtype=str)
+    assert df["stitle"].tolist() == ["NR_1.1 Escherichia coli", "Bacillus subtilis"]
+
+
+def test_log_missing_reports_pass_and_fail(fake_blast: Path, tmp_path: Path):
+    out = tmp_path / "blast.tsv"
+    missing = tmp_path / "missing.txt"
+    rb.run_blast(fake_blast, "nt", out, log_missing=missing)
+
+    assert missing.read_text().split() == ["q2", "q3"]
+    full = pd.read_csv(tmp_path / "hits_full.tsv", sep="\t", dtype=str).set_index("qseqid")
+    assert full.loc["q1", "status"] == "PASS"
+    assert full.loc["q2", "reason"] == "low_identity"
+    assert full.loc["q3", "reason"] == "no_alignment"
+    passed = pd.read_csv(tmp_path / "hits.tsv", sep="\t", dtype=str)
+    assert passed["qseqid"].tolist() == ["q1"]
+    assert passed.columns.tolist() == rb.FIELD_LIST
+
+
+def test_append_file_bytes_resumes_after_partial_sendfile(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A sendfile that stops part-way with an 'unsupported' errno is finished in userland without duplication."""
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    payload = bytes(range(256)) * 64
+    src.write_bytes(payload)
+    real_sendfile = os.sendfile
+    calls = {"n": 0}
+
+    def flaky_sendfile(out_fd, in_fd, offset, count):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return real_sendfile(out_fd, in_fd, offset, min(count, 1000))
+        raise OSError(errno.EINVAL, "sendfile gave up")
+
+    monkeypatch.setattr(os, "sendfile", flaky_sendfile)
+    with dst.open("wb") as out_fh, src.open("rb") as in_fh:
+        out_fh.write(b"HEADER\n")
+        io_utils.append_file_bytes(in_fh, out_fh)
+
+    assert calls["n"] == 2
+    assert dst.read_bytes() == b"HEADER\n" + payload
+
+
+def test_append_file_bytes_without_sendfile(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Platforms lacking os.sendfile use the buffered copy for the whole file."""
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    src.write_bytes(b">r1\nACGT")
+    monkeypatch.delattr(os, "sendfile", raising=False)
+    with dst.open("wb") as out_fh, src.open("rb") as in_fh:
+        out_fh.write(b"H\t")
+        io_utils.append_file_bytes(in_fh, out_fh)
+    assert dst.read_bytes() == b"H\t>r1\nACGT"
+
+
+def test_append_file_bytes_propagates_real_io_errors(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Errors other than 'sendfile unsupported' (e.g. a full disk) must not be masked by the fallback."""
+    src = tmp_path / "src.bin"
+    src.write_bytes(b"data")
+
+    def full_disk(*_args):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(os, "sendfile", full_disk)
+    with (tmp_path / "dst.bin").open("wb") as out_fh, src.open("rb") as in_fh:
+        with pytest.raises(OSError) as excinfo:
+            io_utils.append_file_bytes(in_fh, out_fh)
+    assert excinfo.value.errno == errno.ENOSPC
@@ -9,6 +9,17 @@ def test_load_config():
     cfg = load_config("config/config.yaml")
     assert "tools" in cfg 
 
+def test_load_config_cache_returns_copies_and_sees_edits(tmp_path: pathlib.Path):
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text("tools:\n  cap3: cap3\n")
+
+    first = load_config(cfg_path)
+    first["tools"]["cap3"] = "mutated"
+    assert load_config(cfg_path)["tools"]["cap3"] == "cap3"
+
+    cfg_path.write_text("tools:\n  cap3: /opt/cap3/bin/cap3\n")
+    assert load_config(cfg_path)["tools"]["cap3"] == "/opt/cap3/bin/cap3"
+
 def test_setup_logging(tmp_path: pathlib.Path):
     """
     tmp_path is a py test fixture that yields a fresh, auto-cleaned path. 
@@ -21,3 +32,15 @@ def test_setup_logging(tmp_path: pathlib.Path):
     logs = list(tmp_path.glob("test_*.log"))
     assert logs, "no log file created" 
 
+
+def test_package_import_defers_pipeline():
+    import subprocess
+    code = (
+        "import sys, microseq_tests; "
+        "assert 'microseq_tests.pipeline' not in sys.modules; "
+        "from microseq_tests import pipeline; "
+        "assert pipeline is sys.modules['microseq_tests.pipeline']"
+    )
+    src = pathlib.Path(__file__).resolve().parents[1] / "src"
+    env = {**os.environ, "PYTHONPATH": str(src)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)